@@ -1,4 +1,10 @@
 __version__ = "0.1"
 from .recycleview import RecycleView, RecycleLayoutManager, \
-    LinearRecycleLayoutManager, RecycleAdapter, RecycleViewMixin, \
-    LayoutChangeException, LayoutSelectionMixIn, RecycleViewLayout
+    LinearRecycleLayoutManager, GridRecycleLayoutManager, \
+    StaggeredRecycleLayoutManager, RecycleAdapter, RecycleViewMixin, \
+    LayoutChangeException, LayoutSelectionMixIn, RecycleViewLayout, \
+    RecycleViewPool, RecycleViewStats, RecycleViewTracer, \
+    RecycleViewTraceBuffer, RecycleDataSource, RecycleColumnDataSource, \
+    RecyclePagedDataSource
+from .recycleimage import RecycleImageLoader, RecycleTextureCache, \
+    RecycleThumbnailCache, RecycleImageMixin, get_default_image_loader
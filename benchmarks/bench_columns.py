@@ -0,0 +1,90 @@
+'''
+Compares the memory used by the data, and the time of a full layout, when the
+data is a list of dicts and when it is a :class:`RecycleColumnDataSource`.
+
+The items have the five keys of the contacts example. Run it with::
+
+    export PYTHONPATH=$PWD:$PYTHONPATH
+    python benchmarks/bench_columns.py [items] [size_storage]
+'''
+import sys
+import random
+import tracemalloc
+from timeit import Timer
+from kivy.uix.widget import Widget
+from kivy.garden.recycleview import RecycleView, RecycleColumnDataSource
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+names = ["Robert", "George", "Joseph", "Donald", "Mark", "Anthony", "Gary"]
+media = "http://www.geglobalresearch.com/media/Alhart-Todd-45x45.jpg"
+
+
+def make_dicts(n):
+    return [{
+        "index": i,
+        "viewclass": "ContactItem",
+        "contact_name": random.choice(names),
+        "contact_media": media,
+        "height": random.choice((40., 48., 56.))} for i in range(n)]
+
+
+def make_columns(n):
+    if numpy is not None:
+        index = numpy.arange(n)
+        height = numpy.random.choice((40., 48., 56.), n)
+    else:
+        from array import array
+        index = array('l', range(n))
+        height = array('d', (random.choice((40., 48., 56.))
+                             for _ in range(n)))
+    return RecycleColumnDataSource({
+        "index": index,
+        "viewclass": ["ContactItem"] * n,
+        "contact_name": [random.choice(names) for _ in range(n)],
+        "contact_media": [media] * n,
+        "height": height})
+
+
+def measure(make, n):
+    tracemalloc.start()
+    data = make(n)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return data, memory
+
+
+def bench(rv, n):
+    lm = rv.layout_manager
+    results = []
+    for make in (make_dicts, make_columns):
+        data, memory = measure(make, n)
+        if make is make_dicts:
+            rv.data_source = None
+            rv.data = data
+        else:
+            rv.data = []
+            rv.data_source = data
+        rv.refresh_views()
+        layout = min(Timer(
+            lambda: lm.compute_positions_and_sizes(False)).repeat(
+            repeat=3, number=1))
+        results.extend((memory / float(n), layout * 1e3))
+    return results
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    storage = sys.argv[2] if len(sys.argv) > 2 else 'numpy'
+    rv = RecycleView(size=(100, 100), size_hint=(None, None))
+    rv.viewclass = Widget
+    rv.key_size = 'height'
+    rv.layout_manager.size_storage = storage
+
+    print('{:>10} {:>14} {:>14} {:>14} {:>14}'.format(
+        'items', 'dict B/item', 'dict layout ms', 'cols B/item',
+        'cols layout ms'))
+    print('{:>10} {:>14.1f} {:>14.2f} {:>14.1f} {:>14.2f}'.format(
+        n, *bench(rv, n)))
@@ -0,0 +1,62 @@
+'''
+Micro-benchmark of :meth:`LinearRecycleLayoutManager.get_view_index_at` and
+:meth:`LinearRecycleLayoutManager.update_item_size`.
+
+The lookup is done twice for every scroll event, so its cost must not grow
+with the number of items. Run it with::
+
+    export PYTHONPATH=$PWD:$PYTHONPATH
+    python benchmarks/bench_index_lookup.py [max_items] [size_storage]
+'''
+import sys
+import random
+from timeit import Timer
+from kivy.uix.widget import Widget
+from kivy.garden.recycleview import RecycleView
+
+lookups = 2000
+
+
+def bench(rv, n):
+    # all the items share a dict so the data is cheap to build
+    rv.data = [{}] * n
+    rv.refresh_views()
+    lm = rv.layout_manager
+    end = lm.computed_size
+
+    at_idx = lm.get_view_index_at
+    points = [(random.uniform(0, end), 0) for _ in range(lookups)]
+    indices = [random.randrange(n) for _ in range(lookups)]
+
+    def lookup():
+        for pos in points:
+            at_idx(pos)
+
+    def update():
+        update_item_size = lm.update_item_size
+        for i in indices:
+            update_item_size(i, 24 if lm.computed_sizes[i] == 48 else 48)
+
+    t_lookup = min(Timer(lookup).repeat(repeat=5, number=1))
+    t_update = min(Timer(update).repeat(repeat=5, number=1))
+    return t_lookup / lookups * 1e6, t_update / lookups * 1e6
+
+
+if __name__ == '__main__':
+    max_items = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+    storage = sys.argv[2] if len(sys.argv) > 2 else 'array'
+    rv = RecycleView(size=(100, 100), size_hint=(None, None))
+    rv.viewclass = Widget
+    rv.default_size = 48
+    # a size key makes the sizes be stored per item, as they are otherwise
+    # all the same and computed without the size tree
+    rv.key_size = 'size'
+    lm = rv.layout_manager
+    lm.orientation = 'horizontal'
+    lm.size_storage = storage
+
+    n = 1000
+    print('{:>10} {:>12} {:>12}'.format('items', 'us/lookup', 'us/update'))
+    while n <= max_items:
+        print('{:>10} {:>12.3f} {:>12.3f}'.format(n, *bench(rv, n)))
+        n *= 10
@@ -0,0 +1,291 @@
+'''
+Headless benchmark suite of :class:`RecycleView` workloads, to compare the
+frame times of different versions of the recycleview, Kivy or Python.
+
+Each workload drives a new :class:`RecycleView` through scripted frames: a
+frame changes the scroll position or the data, then refreshes the views and
+ticks the clock once, as the window would. The GL calls are mocked, so no
+display is needed. For every workload it reports the frame time percentiles,
+the number of views created and reused (rebound to another item) and of
+widgets added to and removed from the container during the frames, the view
+pool stats, and the peak memory per item of building the data and its first
+layout, measured in a separate run with tracemalloc.
+
+With `--no-detach`, the views that are no longer displayed are kept hidden in
+the container instead of being removed, see `RecycleAdapter.detach_views`.
+
+The results are printed as JSON. Run it with::
+
+    export PYTHONPATH=$PWD:$PYTHONPATH
+    python benchmarks/bench_workloads.py [-n items] [-f frames] \\
+        [-o results.json] [--no-detach] [workload ...]
+'''
+import os
+os.environ.setdefault('KIVY_GL_BACKEND', 'mock')
+os.environ['KIVY_NO_ARGS'] = '1'
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+
+import gc
+import sys
+import json
+import random
+import platform
+import argparse
+import tracemalloc
+from functools import partial
+from timeit import default_timer
+from kivy.config import Config
+Config.set('graphics', 'maxfps', '0')
+
+import kivy
+from kivy.clock import Clock
+from kivy.lang import Builder
+from kivy.garden.recycleview import RecycleView
+import kivy.garden.recycleview as recycleview
+
+# the contacts example, with a plain widget instead of the image
+Builder.load_string('''
+<BenchSeparator@Widget>:
+    canvas.before:
+        Color:
+            rgb: (.5, .5, .5)
+        Rectangle:
+            pos: self.pos
+            size: self.size
+
+<BenchContact@BoxLayout>:
+    index: 0
+    contact_name: ""
+    Widget:
+        size_hint_x: None
+        width: self.height
+    Label:
+        text: root.contact_name
+        text_size: (self.width, None)
+
+<BenchCard@BoxLayout>:
+    orientation: "vertical"
+    title: ""
+    body: ""
+    Label:
+        text: root.title
+    Label:
+        text: root.body
+''')
+
+names = ["Robert", "George", "Joseph", "Donald", "Mark", "Anthony", "Gary"]
+
+
+def contacts(n, start=0):
+    data = []
+    for x in range(start, start + n):
+        if x % 100 == 0:
+            data.append({
+                "index": "separator-{}".format(x),
+                "viewclass": "BenchSeparator", "height": 20.})
+        data.append({
+            "index": x, "viewclass": "BenchContact", "height": 48.,
+            "contact_name": "{} {}".format(
+                random.choice(names), random.choice(names))})
+    return data
+
+
+def mixed(n):
+    data = []
+    for x in range(n):
+        kind = random.random()
+        if kind < .05:
+            data.append({"viewclass": "BenchSeparator", "height": 20.})
+        elif kind < .7:
+            data.append({
+                "viewclass": "BenchContact", "height": 48.,
+                "contact_name": random.choice(names)})
+        else:
+            data.append({
+                "viewclass": "BenchCard",
+                "height": random.choice((96., 120., 160.)),
+                "title": random.choice(names),
+                "body": " ".join(random.sample(names, 4))})
+    return data
+
+
+def sort_key(contact):
+    if contact["viewclass"] == "BenchSeparator":
+        return ""
+    return contact["contact_name"]
+
+
+# each workload is a setup function, building the data, and a frame function
+# changing the recycleview in frame i of the frames. The setup returns the
+# state passed to the frames.
+
+def setup_contacts(rv, n):
+    rv.data = contacts(n)
+
+
+def frame_sweep(rv, state, i, frames):
+    rv.scroll_y = 1 - i / float(max(frames - 1, 1))
+
+
+def frame_jump(rv, state, i, frames):
+    rv.scroll_y = i % 2
+
+
+def setup_replace(rv, n):
+    rv.data = contacts(n)
+    return contacts(n), rv.data
+
+
+def frame_replace(rv, state, i, frames):
+    rv.data = state[i % 2]
+
+
+def setup_append(rv, n):
+    rv.data = contacts(n)
+    return [n]
+
+
+def frame_append(rv, state, i, frames):
+    rv.data.extend(contacts(10, state[0]))
+    state[0] += 10
+    rv.scroll_y = 0
+
+
+def setup_sort(rv, n):
+    rv.data = contacts(n)
+    return (sorted(rv.data, key=sort_key),
+            sorted(rv.data, key=sort_key, reverse=True))
+
+
+def frame_sort(rv, state, i, frames):
+    rv.data = state[i % 2]
+
+
+def setup_mixed(rv, n):
+    rv.data = mixed(n)
+
+
+workloads = {
+    'scroll_sweep': (setup_contacts, frame_sweep),
+    'jump_to_end': (setup_contacts, frame_jump),
+    'replace_data': (setup_replace, frame_replace),
+    'append_stream': (setup_append, frame_append),
+    'sort_data': (setup_sort, frame_sort),
+    'mixed_viewclass': (setup_mixed, frame_sweep),
+}
+
+
+def percentile(values, p):
+    values = sorted(values)
+    k = max(0, min(len(values) - 1, int(round(p / 100. * len(values))) - 1))
+    return values[k]
+
+
+def new_recycleview(detach):
+    rv = RecycleView(size=(480, 800), size_hint=(None, None))
+    rv.key_viewclass = "viewclass"
+    rv.key_size = "height"
+    rv.adapter.detach_views = detach
+    return rv
+
+
+def measure_memory(setup, n, detach):
+    gc.collect()
+    tracemalloc.start()
+    rv = new_recycleview(detach)
+    setup(rv, n)
+    rv.refresh_views()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / float(n)
+
+
+def count_calls(counts, name, f):
+    def wrapper(*largs, **kwargs):
+        counts[name] += 1
+        return f(*largs, **kwargs)
+    return wrapper
+
+
+def run(name, n, frames, detach=True):
+    setup, frame = workloads[name]
+    random.seed(0)
+    rv = new_recycleview(detach)
+    t = default_timer()
+    state = setup(rv, n)
+    rv.refresh_views()
+    Clock.tick()
+    setup_time = default_timer() - t
+
+    adapter = rv.adapter
+    pool = adapter.view_pool
+    pool_stats = pool.get_stats()
+    counts = {'create_view': 0, 'refresh_view_attrs': 0}
+    for method in counts:
+        setattr(adapter, method,
+                count_calls(counts, method, getattr(adapter, method)))
+    container = rv.container
+    for method in ('add_widget', 'remove_widget'):
+        counts[method] = 0
+        setattr(container, method,
+                count_calls(counts, method, getattr(container, method)))
+
+    times = []
+    gc.collect()
+    for i in range(frames):
+        t = default_timer()
+        frame(rv, state, i, frames)
+        rv.refresh_views()
+        Clock.tick()
+        times.append((default_timer() - t) * 1e3)
+
+    stats = pool.get_stats()
+    created = counts['create_view']
+    return {
+        'setup_ms': setup_time * 1e3,
+        'frame_ms': {
+            'mean': sum(times) / len(times), 'p50': percentile(times, 50),
+            'p90': percentile(times, 90), 'p99': percentile(times, 99),
+            'max': max(times)},
+        'views_created': created,
+        # views created also sync their data once
+        'views_reused': counts['refresh_view_attrs'] - created,
+        'widgets_added': counts['add_widget'],
+        'widgets_removed': counts['remove_widget'],
+        'pool_hits': stats['hits'] - pool_stats['hits'],
+        'pool_misses': stats['misses'] - pool_stats['misses'],
+        'pool_evictions': stats['evictions'] - pool_stats['evictions'],
+        'peak_bytes_per_item': measure_memory(setup, n, detach),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Headless RecycleView benchmarks, printed as JSON.')
+    parser.add_argument('workloads', nargs='*', choices=[[]] + sorted(
+        workloads), help='the workloads to run, all by default')
+    parser.add_argument('-n', '--items', type=int, default=10000)
+    parser.add_argument('-f', '--frames', type=int, default=300)
+    parser.add_argument('-o', '--output', help='also write the JSON there')
+    parser.add_argument(
+        '--no-detach', action='store_true',
+        help='keep the views no longer displayed hidden in the container')
+    args = parser.parse_args()
+
+    results = {
+        'versions': {
+            'recycleview': getattr(recycleview, '__version__', None),
+            'kivy': kivy.__version__, 'python': platform.python_version()},
+        'platform': platform.platform(),
+        'items': args.items,
+        'frames': args.frames,
+        'detach_views': not args.no_detach,
+        'workloads': {name: run(name, args.items, args.frames,
+                                not args.no_detach)
+                      for name in args.workloads or sorted(workloads)},
+    }
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    print(text)
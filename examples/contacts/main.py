@@ -65,6 +65,8 @@ class RecycleViewApp(App):
         rv = self.root.ids.rv
         rv.key_viewclass = "viewclass"
         rv.key_size = "height"
+        rv.key_id = "index"
+        rv.layout_manager.key_header = "header"
         self.generate_new_data()
 
     def generate_new_data(self):
@@ -78,7 +80,9 @@ class RecycleViewApp(App):
         for x in range(1000):
             if x % 100 == 0:
                 contacts.append({
+                    "index": "separator-{}".format(x),
                     "viewclass": "ContactSeparator",
+                    "header": True,
                     "height": sp(20)
                 })
             contacts.append({
@@ -1,10 +1,17 @@
 from kivy.app import App
 from kivy.properties import ListProperty
-from kivy.garden.recycleview import RecycleView
+from kivy.uix.image import Image
+from kivy.garden.recycleview import RecycleView, RecycleImageMixin, \
+    RecycleThumbnailCache, get_default_image_loader
 from kivy.lang import Builder
 from os.path import dirname, join
 from glob import glob
 
+
+class WallImage(RecycleImageMixin, Image):
+    pass
+
+
 class WallimageApp(App):
     data = ListProperty()
     def build(self):
@@ -14,4 +21,11 @@ class WallimageApp(App):
             data.append({"width": 500, "source": image})
         self.data = data * 100
 
+        # the images are read from downscaled copies, made in the background
+        loader = get_default_image_loader()
+        loader.thumbnails = RecycleThumbnailCache(
+            filename=join(self.user_data_dir, "thumbnails.rvt"))
+        loader.generate_thumbnails(
+            (item["source"] for item in data), (500, 500))
+
 WallimageApp().run()
@@ -0,0 +1,668 @@
+"""
+RecycleView images
+==================
+
+Loading of the images shown by the views of a :class:`RecycleView` without
+blocking the UI: the images are decoded by a :class:`RecycleImageLoader` on
+worker threads and their textures kept in a :class:`RecycleTextureCache`, so
+that scrolling back to an image doesn't decode it again.
+
+Views based on :class:`~kivy.uix.image.Image` inherit from
+:class:`RecycleImageMixin`, which loads the image of their data's `source`
+through the loader instead of setting the image's `source`, which would
+decode it synchronously::
+
+    class WallImage(RecycleImageMixin, Image):
+        pass
+
+The images of the items prepared ahead of being visible, see
+:attr:`RecycleLayoutManager.overscan`, are requested as well, and the
+requests of the views that are synced with another item before their image
+was decoded are cancelled.
+
+With `PIL` installed, the images are decoded at the view's
+:attr:`RecycleImageMixin.decode_size`, e.g. JPEGs are decoded at a reduced
+scale. Otherwise they are decoded at full size with the Kivy image loaders.
+
+For large collections of photos, a :class:`RecycleThumbnailCache` keeps
+downscaled copies of the images in a file, so that they are read instead of
+the originals, and can make them ahead for a whole data set::
+
+    loader = get_default_image_loader()
+    loader.thumbnails = RecycleThumbnailCache(filename='thumbnails.rvt')
+    loader.generate_thumbnails(
+        (item['source'] for item in data), (500, 500))
+"""
+
+from kivy.properties import NumericProperty, ObjectProperty, StringProperty
+from kivy.event import EventDispatcher
+from kivy.clock import Clock
+from kivy.logger import Logger
+from kivy.core.image import ImageLoader, ImageData
+from kivy.graphics.texture import Texture
+from collections import OrderedDict
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+import os
+import json
+import mmap
+import struct
+import threading
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
+from .recycleview import RecycleViewMixin
+
+_bytes_per_pixel = {
+    'rgb': 3, 'bgr': 3, 'luminance': 1, 'alpha': 1, 'red': 1,
+    'luminance_alpha': 2, 'rg': 2}
+
+
+def _texture_bytes(texture):
+    width, height = texture.size
+    return width * height * _bytes_per_pixel.get(texture.colorfmt, 4)
+
+
+class RecycleTextureCache(EventDispatcher):
+    '''A cache of textures bounded by their size in bytes. When full, the
+    least recently used textures are evicted.
+    '''
+
+    max_bytes = NumericProperty(128 * 1024 * 1024)
+    '''The maximum size, in bytes, of the textures in the cache, counted as
+    their width * height * bytes per pixel.
+    '''
+
+    hits = 0
+    '''The number of times a texture was found in the cache.
+    '''
+    misses = 0
+    '''The number of times a texture was not in the cache.
+    '''
+    evictions = 0
+    '''The number of textures evicted from the cache.
+    '''
+
+    def __init__(self, **kwargs):
+        # the textures and their size, least recently used first
+        self._textures = OrderedDict()
+        self.size_bytes = 0
+        super(RecycleTextureCache, self).__init__(**kwargs)
+
+    def __len__(self):
+        return len(self._textures)
+
+    def __contains__(self, key):
+        return key in self._textures
+
+    def get(self, key):
+        '''Returns the texture of `key`, or None if it's not in the cache.
+        '''
+        textures = self._textures
+        item = textures.pop(key, None)
+        if item is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        textures[key] = item
+        return item[0]
+
+    def add(self, key, texture):
+        '''Adds the `texture` of `key`, evicting the least recently used
+        textures if over :attr:`max_bytes`.
+        '''
+        textures = self._textures
+        old = textures.pop(key, None)
+        if old is not None:
+            self.size_bytes -= old[1]
+        size = _texture_bytes(texture)
+        textures[key] = texture, size
+        self.size_bytes += size
+        self.trim(self.max_bytes)
+
+    def trim(self, target):
+        '''Evicts the least recently used textures until at most `target`
+        bytes are used, but never the most recently added texture.
+        '''
+        textures = self._textures
+        while self.size_bytes > target and len(textures) > 1:
+            texture, size = textures.popitem(last=False)[1]
+            self.size_bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        self._textures.clear()
+        self.size_bytes = 0
+
+    def on_max_bytes(self, instance, value):
+        self.trim(value)
+
+    def get_stats(self):
+        '''Returns a dict with the number of textures, their `bytes`, and the
+        number of `hits`, `misses` and `evictions`.
+        '''
+        return {
+            'size': len(self._textures), 'bytes': self.size_bytes,
+            'hits': self.hits, 'misses': self.misses,
+            'evictions': self.evictions}
+
+
+def _fit_image(image, size):
+    # jpeg images are decoded at a reduced scale
+    image.draft('RGB', size)
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.mode or
+                              'transparency' in image.info else 'RGB')
+    image.thumbnail(size)
+    return image
+
+
+# a record of a thumbnail container file: the magic, the length of the json
+# header and the length of the encoded image, followed by them
+_thumbnail_record = struct.Struct('<4sII')
+_thumbnail_magic = b'RVT1'
+
+
+def _write_thumbnail(f, header, data):
+    header_data = json.dumps(header).encode('utf8')
+    f.seek(0, os.SEEK_END)
+    offset = f.tell() + _thumbnail_record.size + len(header_data)
+    f.write(_thumbnail_record.pack(
+        _thumbnail_magic, len(header_data), len(data)))
+    f.write(header_data)
+    f.write(data)
+    return offset
+
+
+class RecycleThumbnailCache(EventDispatcher):
+    '''An on-disk cache of downscaled images, kept in a single container file
+    that is memory-mapped for reading. Requires `PIL`.
+
+    A thumbnail is keyed by the path and modification time of its image and
+    the size it was made to fit in, so it's made again when the image is
+    modified. When an image is loaded at a size, the smallest of its
+    thumbnails that is at least that large is read instead of the image,
+    otherwise a thumbnail is made from the image and appended to the file.
+
+    The thumbnails of a whole data set can be made ahead with
+    :meth:`generate`. A :class:`RecycleImageLoader` uses the cache set to its
+    :attr:`RecycleImageLoader.thumbnails`.
+    '''
+
+    filename = StringProperty('')
+    '''The path of the container file, created if it doesn't exist. It must
+    be set before the cache is used.
+    '''
+
+    quality = NumericProperty(85)
+    '''The JPEG quality of the thumbnails. The images with transparency are
+    kept as PNG.
+    '''
+
+    max_workers = NumericProperty(2)
+    '''The number of worker threads making the thumbnails in
+    :meth:`generate`. It is read on its first call.
+    '''
+
+    def __init__(self, **kwargs):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._generating = set()
+        self._file = None
+        self._map = None
+        # the thumbnails of each image by path and mtime, then by the size
+        # they fit in: their offset and length in the file, their size and
+        # whether it's the size of the image
+        self._index = {}
+        super(RecycleThumbnailCache, self).__init__(**kwargs)
+
+    def on_filename(self, instance, value):
+        with self._lock:
+            self._close_file()
+
+    def _open(self):
+        if self._file is not None:
+            return
+        if not self.filename:
+            raise ValueError('RecycleThumbnailCache.filename is not set')
+        f = self._file = open(self.filename, 'a+b')
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if not size:
+            return
+
+        m = self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        record_size = _thumbnail_record.size
+        offset = 0
+        while offset + record_size <= size:
+            magic, header_length, length = _thumbnail_record.unpack_from(
+                m, offset)
+            start = offset + record_size + header_length
+            if magic != _thumbnail_magic or start + length > size:
+                break
+            try:
+                header = json.loads(
+                    m[offset + record_size:start].decode('utf8'))
+            except ValueError:
+                break
+            self._add_record(header, start, length)
+            offset = start + length
+
+        if offset < size:
+            # the end of an interrupted write, it's written over
+            m.close()
+            self._map = None
+            f.truncate(offset)
+
+    def _close_file(self):
+        if self._map is not None:
+            self._map.close()
+        if self._file is not None:
+            self._file.close()
+        self._map = self._file = None
+        self._index = {}
+
+    def _add_record(self, header, offset, length):
+        thumbnails = self._index.setdefault(
+            (header['path'], header['mtime']), {})
+        thumbnails[tuple(header['box'])] = (
+            offset, length, tuple(header['size']), header['full'])
+
+    def _read(self, offset, length):
+        m = self._map
+        if m is None or offset + length > len(m):
+            # the file grew since it was mapped
+            m = self._map = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return m[offset:offset + length]
+
+    def _stat(self, source):
+        path = os.path.abspath(source)
+        return path, os.stat(path).st_mtime_ns
+
+    def __len__(self):
+        with self._lock:
+            self._open()
+            return sum(len(thumbnails) for thumbnails in self._index.values())
+
+    def get(self, source, size):
+        '''Returns the encoded thumbnail of the image `source` that is the
+        smallest at least as large as `size`, or None if there's none.
+        '''
+        key = self._stat(source)
+        width, height = size
+        with self._lock:
+            self._open()
+            best = None
+            for box, thumbnail in self._index.get(key, {}).items():
+                if thumbnail[3] or box[0] >= width and box[1] >= height:
+                    area = thumbnail[2][0] * thumbnail[2][1]
+                    if best is None or area < best[0]:
+                        best = area, thumbnail
+            if best is None:
+                return None
+            return self._read(best[1][0], best[1][1])
+
+    def add(self, source, size):
+        '''Makes the thumbnail of the image `source` fitting in `size`, adds
+        it to the file and returns it encoded.
+        '''
+        path, mtime = self._stat(source)
+        original = PILImage.open(path)
+        try:
+            # draft changes the size of the image
+            full_size = original.size
+            image = _fit_image(original, size)
+            data = BytesIO()
+            if image.mode == 'RGBA':
+                image.save(data, 'PNG')
+            else:
+                image.save(data, 'JPEG', quality=int(self.quality))
+            header = {
+                'path': path, 'mtime': mtime, 'box': list(size),
+                'size': list(image.size), 'full': image.size == full_size}
+        finally:
+            original.close()
+        data = data.getvalue()
+
+        with self._lock:
+            self._open()
+            offset = _write_thumbnail(self._file, header, data)
+            self._file.flush()
+            self._add_record(header, offset, len(data))
+        return data
+
+    def load(self, source, size):
+        '''Returns the `PIL` image of the smallest thumbnail of the image
+        `source` at least as large as `size`, making it if there's none. It
+        may be larger than `size`.
+        '''
+        data = self.get(source, size)
+        if data is None:
+            data = self.add(source, size)
+        return PILImage.open(BytesIO(data))
+
+    def generate(self, sources, size, callback=None):
+        '''Makes on worker threads the missing thumbnails of the images
+        `sources` at `size`, e.g. of all the items of a data set. Once done,
+        `callback(count)` is called in the UI thread with the number of
+        thumbnails made. Returns the futures of the thumbnails, which can be
+        cancelled.
+        '''
+        sources = list(OrderedDict.fromkeys(s for s in sources if s))
+        size = tuple(size)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(int(self.max_workers))
+        # the number of thumbnails left and made
+        counts = [len(sources), 0]
+        lock = threading.Lock()
+
+        def done(future):
+            self._generating.discard(future)
+            with lock:
+                counts[0] -= 1
+                if not future.cancelled() and future.result():
+                    counts[1] += 1
+                if counts[0]:
+                    return
+            if callback is not None:
+                Clock.schedule_once(lambda dt: callback(counts[1]))
+
+        futures = [self._executor.submit(self._generate, source, size)
+                   for source in sources]
+        self._generating.update(futures)
+        for future in futures:
+            future.add_done_callback(done)
+        if not futures and callback is not None:
+            Clock.schedule_once(lambda dt: callback(0))
+        return futures
+
+    def _generate(self, source, size):
+        try:
+            if self.get(source, size) is None:
+                self.add(source, size)
+                return True
+        except Exception:
+            Logger.exception(
+                'RecycleThumbnailCache: Failed to make the thumbnail of '
+                '{}'.format(source))
+        return False
+
+    def compact(self):
+        '''Rewrites the file without the thumbnails of the images modified
+        or removed since they were made.
+        '''
+        with self._lock:
+            self._open()
+            filename = self.filename
+            with open(filename + '.tmp', 'wb') as f:
+                for (path, mtime), thumbnails in self._index.items():
+                    try:
+                        if os.stat(path).st_mtime_ns != mtime:
+                            continue
+                    except OSError:
+                        continue
+                    for box, (offset, length, size, full) in \
+                            thumbnails.items():
+                        header = {
+                            'path': path, 'mtime': mtime, 'box': list(box),
+                            'size': list(size), 'full': full}
+                        _write_thumbnail(f, header, self._read(offset, length))
+            self._close_file()
+            os.replace(filename + '.tmp', filename)
+
+    def close(self):
+        '''Cancels the thumbnails being generated and closes the file.
+        '''
+        for future in list(self._generating):
+            future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        with self._lock:
+            self._close_file()
+
+
+class RecycleImageLoader(EventDispatcher):
+    '''Decodes images on worker threads and keeps their textures in a
+    :class:`RecycleTextureCache`.
+
+    An image is requested with :meth:`request` by its source and the size it
+    is decoded at, which are the key of its texture in the cache. An image is
+    only decoded once at a time, for all the requests. The decodes that are
+    no longer requested, see :meth:`cancel`, are cancelled if not started
+    yet. The textures are created in the UI thread.
+    '''
+
+    max_workers = NumericProperty(2)
+    '''The number of worker threads decoding images. It is read when the
+    first image is requested.
+    '''
+
+    cache = ObjectProperty(None)
+    '''The :class:`RecycleTextureCache` of the textures. A new cache by
+    default.
+    '''
+
+    size_step = NumericProperty(64)
+    '''The decode sizes are rounded up to multiples of it, so that views of
+    slightly different sizes share the textures.
+    '''
+
+    thumbnails = ObjectProperty(None, allownone=True)
+    '''A :class:`RecycleThumbnailCache` from which the images requested at
+    a size are read, instead of decoding the original images, or None, the
+    default.
+    '''
+
+    def __init__(self, **kwargs):
+        self._executor = None
+        # the decodes, and the callbacks waiting for them, by key
+        self._decoding = {}
+        self._waiting = {}
+        super(RecycleImageLoader, self).__init__(**kwargs)
+        if self.cache is None:
+            self.cache = RecycleTextureCache()
+
+    def get_key(self, source, size):
+        '''Returns the key of the texture of the image `source` decoded to
+        fit in `size`, or at full size when `size` is None.
+        '''
+        if size is None or PILImage is None:
+            # the kivy loaders only decode at full size
+            return source, None
+        step = max(1, int(self.size_step))
+        return source, tuple(
+            max(step, -(-int(value) // step) * step) for value in size)
+
+    def request(self, source, size, callback=None):
+        '''Requests the texture of the image `source` decoded to fit in
+        `size`, see :meth:`get_key`. Returns the texture if it's in the cache,
+        otherwise None, and once decoded `callback(key, texture)` is called in
+        the UI thread. `texture` is None if the image couldn't be loaded.
+
+        Without a `callback`, the image is decoded ahead of being shown, until
+        :meth:`cancel` is called with no callback.
+        '''
+        key = self.get_key(source, size)
+        texture = self.cache.get(key)
+        if texture is not None:
+            return texture
+        waiting = self._waiting.get(key)
+        if waiting is None:
+            waiting = self._waiting[key] = []
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(int(self.max_workers))
+            future = self._decoding[key] = self._executor.submit(
+                self.decode, *key)
+            future.add_done_callback(partial(self._schedule_decoded, key))
+        waiting.append(callback)
+        return None
+
+    def cancel(self, source, size, callback=None):
+        '''Removes a :meth:`request` with the same arguments. The decode is
+        cancelled if no other request waits for it and it did not start yet.
+        '''
+        key = self.get_key(source, size)
+        waiting = self._waiting.get(key)
+        if waiting is None or callback not in waiting:
+            return
+        waiting.remove(callback)
+        if not waiting and self._decoding[key].cancel():
+            del self._waiting[key]
+            del self._decoding[key]
+
+    def decode(self, source, size):
+        '''Called on a worker thread to decode the image `source` to fit in
+        `size`, or at full size if None. It returns the
+        :class:`~kivy.core.image.ImageData`, or an object with a `texture`
+        attribute that creates the texture when read in the UI thread, e.g. a
+        Kivy image loader.
+        '''
+        if size is None:
+            return ImageLoader.load(source, keep_data=True, nocache=True)
+
+        thumbnails = self.thumbnails
+        if thumbnails is not None:
+            original = thumbnails.load(source, size)
+        else:
+            original = PILImage.open(source)
+        try:
+            image = _fit_image(original, size)
+            return ImageData(
+                image.size[0], image.size[1], image.mode.lower(),
+                image.tobytes(), source=source)
+        finally:
+            original.close()
+
+    def generate_thumbnails(self, sources, size, callback=None):
+        '''Makes in the background the :attr:`thumbnails` of the images
+        `sources` requested at `size`, see
+        :meth:`RecycleThumbnailCache.generate`. E.g. for the items of a
+        :class:`RecycleView` with :class:`RecycleImageMixin` views::
+
+            loader.generate_thumbnails(
+                (item['source'] for item in rv.data), view.decode_size)
+
+        Without `PIL`, the images are decoded at full size and no thumbnail is
+        made. :attr:`thumbnails` must be set.
+        '''
+        if self.thumbnails is None:
+            raise ValueError('RecycleImageLoader.thumbnails is not set')
+        size = self.get_key(None, size)[1]
+        if size is None:
+            return []
+        return self.thumbnails.generate(sources, size, callback)
+
+    def _schedule_decoded(self, key, future):
+        # called from the worker thread, the texture is made in the ui thread
+        if not future.cancelled():
+            Clock.schedule_once(partial(self._decoded, key, future))
+
+    def _decoded(self, key, future, *largs):
+        if self._decoding.get(key) is not future:
+            return
+        del self._decoding[key]
+        waiting = self._waiting.pop(key)
+        texture = None
+        try:
+            image = future.result()
+            if isinstance(image, ImageData):
+                texture = Texture.create_from_data(image)
+                # the rows are top down, as with the kivy image loaders
+                if image.flip_vertical:
+                    texture.flip_vertical()
+            else:
+                texture = image.texture
+        except Exception:
+            Logger.exception(
+                'RecycleImageLoader: Failed to load {}'.format(key[0]))
+        if texture is not None:
+            self.cache.add(key, texture)
+        for callback in waiting:
+            if callback is not None:
+                callback(key, texture)
+
+    def close(self):
+        '''Cancels the decodes and stops the worker threads.
+        '''
+        for future in self._decoding.values():
+            future.cancel()
+        self._decoding = {}
+        self._waiting = {}
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+_default_loader = None
+
+
+def get_default_image_loader():
+    '''Returns the :class:`RecycleImageLoader` shared by the views whose
+    :attr:`RecycleImageMixin.image_loader` is None.
+    '''
+    global _default_loader
+    if _default_loader is None:
+        _default_loader = RecycleImageLoader()
+    return _default_loader
+
+
+class RecycleImageMixin(RecycleViewMixin):
+    '''A base class for the :class:`~kivy.uix.image.Image` views of a
+    :class:`RecycleView`. The image of the :attr:`image_key` of their data is
+    loaded with a :class:`RecycleImageLoader` and shown by setting the view's
+    `texture`. The texture is None while the image is decoded.
+    '''
+
+    image_key = StringProperty('source')
+    '''The data key of the image source.
+    '''
+
+    decode_size = ObjectProperty(None, allownone=True)
+    '''The size the image is decoded to fit in, e.g. `(500, 500)`, or None,
+    the default, to decode it at full size. Only used when `PIL` is
+    installed.
+    '''
+
+    image_loader = ObjectProperty(None, allownone=True)
+    '''The :class:`RecycleImageLoader` loading the images, or None to use the
+    default one, see :func:`get_default_image_loader`.
+    '''
+
+    # the source and size of the image requested and not loaded yet
+    _image_request = None
+
+    def refresh_view_attrs(self, rv, data):
+        key = self.image_key
+        for name, value in data.items():
+            if name != key:
+                setattr(self, name, value)
+        self.load_image(data.get(key))
+
+    def load_image(self, source):
+        '''Shows the image `source`, from the cache, or once decoded. Cancels
+        the request of the previous image if it's not decoded yet.
+        '''
+        loader = self.image_loader or get_default_image_loader()
+        size = self.decode_size
+        request = self._image_request
+        if request is not None:
+            if request == (source, size):
+                return
+            loader.cancel(request[0], request[1], self._image_loaded)
+            self._image_request = None
+
+        texture = None
+        if source:
+            texture = loader.request(source, size, self._image_loaded)
+            if texture is None:
+                self._image_request = source, size
+        self.texture = texture
+
+    def _image_loaded(self, key, texture):
+        self._image_request = None
+        self.texture = texture
@@ -4,7 +4,7 @@ RecycleView
 
 A flexible view for providing a limited window into a large data set.
 
-Data accepted: list of dict.
+Data accepted: list of dict, or a :class:`RecycleDataSource`.
 
 TODO:
     - add custom function to get view height
@@ -12,7 +12,6 @@ TODO:
     - update view size when created
     - move all internals to adapter
     - selection
-    - Method to clear cached class instances.
 """
 
 import kivy
@@ -21,14 +20,28 @@ from kivy.uix.widget import Widget
 from kivy.uix.scrollview import ScrollView
 from kivy.properties import NumericProperty, AliasProperty, StringProperty, \
     ObjectProperty, ListProperty, OptionProperty, BooleanProperty, \
-    ObservableDict
+    DictProperty, ObservableDict
 from kivy.uix.behaviors import CompoundSelectionBehavior
 from kivy.event import EventDispatcher
 from kivy.factory import Factory
 from kivy.clock import Clock
-from collections import defaultdict
+from kivy.logger import Logger
+from collections import defaultdict, OrderedDict, deque
 from functools import partial
+from weakref import WeakKeyDictionary
+from timeit import default_timer
+from itertools import islice, chain, accumulate
+from bisect import bisect_left, bisect_right
+from array import array
 from distutils.version import LooseVersion
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import threading
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 _kivy_1_9_1 = LooseVersion(kivy.__version__) >= LooseVersion('1.9.1')
 
@@ -37,24 +50,686 @@ _view_base_cache = {}
 class inherits from :class:`RecycleViewMixin`.
 '''
 
-_cached_views = defaultdict(list)
-'''A size limited cache that contains old views (instances) that are not used.
-Each key is a class whose value is the list of the instances of that class.
+_view_attrs_cache = {}
+'''Cache whose keys are classes and values is a boolean indicating whether the
+class overrides :meth:`RecycleViewMixin.refresh_view_attrs`.
+'''
+
+_view_data = WeakKeyDictionary()
+'''Cache whose keys are views and values is a copy of the data dict the view
+was last synced with.
 '''
-# current number of unused classes in the class cache
-_cache_count = 0
-# maximum number of items in the class cache
-_max_cache_size = 1000
 
-def _clean_cache():
-    '''Trims _cached_views cache to half the size of `_max_cache_size`.
+_hidden_views = WeakKeyDictionary()
+'''Cache whose keys are the views hidden in a container, see
+:attr:`RecycleAdapter.detach_views`, and values the canvas of the container
+their canvas was removed from.
+'''
+
+
+def _hide_view(view):
+    parent = view.parent
+    if view in _hidden_views or parent is None:
+        return
+    # its canvas is taken out of the container's so that it isn't drawn,
+    # without setting any of its properties, which the data may set too. It's
+    # not moved, as it would lay out its children, but RecycleViewLayout
+    # skips it for the touches
+    parent.canvas.remove(view.canvas)
+    _hidden_views[view] = parent.canvas
+
+
+def _show_view(view):
+    canvas = _hidden_views.pop(view, None)
+    # unless it was removed from the container meanwhile
+    if canvas is not None and view.parent is not None and \
+            view.parent.canvas is canvas:
+        canvas.add(view.canvas)
+
+
+def _discard_view(view):
+    # a view evicted from the pool may still be hidden in a container
+    if view in _hidden_views:
+        _show_view(view)
+        if view.parent is not None:
+            view.parent.remove_widget(view)
+
+
+def _get_data_changes(last_op, last_len, new_len):
+    '''Returns the list of `(extent, start, stop)` changes done to a data list
+    by the operation `last_op` of a :class:`~kivy.properties.ObservableList`,
+    that was `last_len` long and is now `new_len` long. `extent` is one of
+    `'data_add'`, `'data_modified'`, `'data_insert'` and `'data_remove'`.
+
+    Returns None when the changes cannot be described by index ranges.
+    '''
+    if isinstance(last_op, tuple):
+        op, val = last_op
+    else:
+        op, val = last_op, None
+    diff = new_len - last_len
+
+    if op in ('__iadd__', '__imul__', 'append', 'extend'):
+        if diff < 0:
+            return None
+        return [('data_add', last_len, new_len)]
+
+    if op == 'insert':
+        if diff != 1 or val is None:
+            return None
+        if val < 0:
+            val = max(0, last_len + val)
+        val = min(val, last_len)
+        return [('data_insert', val, val + 1)]
+
+    if op == 'pop':
+        if diff != -1 or val is None:
+            return None
+        index = val[0] if val else last_len - 1
+        if index < 0:
+            index += last_len
+        return [('data_remove', index, index + 1)]
+
+    if op in ('__setslice__', '__delslice__') and val is not None:
+        val = slice(*val)
+    elif op not in ('__setitem__', '__delitem__') or val is None:
+        return None
+    delete = op in ('__delitem__', '__delslice__')
+
+    if not isinstance(val, slice):
+        if val < 0:
+            val += last_len
+        if delete:
+            return [('data_remove', val, val + 1)] if diff == -1 else None
+        return [('data_modified', val, val + 1)] if not diff else None
+
+    start, stop, step = val.indices(last_len)
+    if step != 1:
+        # extended slices are only assigned with the same number of items
+        if delete or diff or not len(range(start, stop, step)):
+            return None if delete or diff else []
+        if step < 0:
+            start, stop = stop + 1, start + 1
+        return [('data_modified', start, stop)]
+
+    stop = max(start, stop)
+    removed = stop - start
+    if delete:
+        return [('data_remove', start, stop)] if diff == -removed else None
+    inserted = removed + diff
+    if inserted < 0:
+        return None
+
+    common = min(removed, inserted)
+    changes = []
+    if common:
+        changes.append(('data_modified', start, start + common))
+    if inserted > removed:
+        changes.append(('data_insert', start + common, start + inserted))
+    elif removed > inserted:
+        changes.append(('data_remove', start + common, stop))
+    return changes
+
+
+def _new_sizes(storage, count, values=None, fill=0):
+    '''Returns a `storage` kind (see
+    :attr:`LinearRecycleLayoutManager.size_storage`) sequence of `count`
+    sizes, taken from the `values` iterable or, if None, all set to `fill`.
+    '''
+    if storage == 'numpy':
+        if numpy is None:
+            raise ImportError('numpy is required for the numpy size_storage')
+        if values is None:
+            return numpy.full(count, fill, dtype=numpy.float64)
+        if isinstance(values, (array, numpy.ndarray)):
+            return numpy.array(values, dtype=numpy.float64)
+        return numpy.fromiter(values, numpy.float64, count)
+
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        values = values.astype(numpy.float64)
+        if storage == 'array':
+            return array('d', values.tobytes())
+        return values.tolist()
+    if values is None:
+        if storage == 'array':
+            return array('d', [fill]) * count
+        return [fill] * count
+    if storage == 'array':
+        return array('d', values)
+    return list(values)
+
+
+def _concat_sizes(sizes, new_sizes):
+    '''Appends `new_sizes` to `sizes` and returns the result, which may be
+    a new object.
+    '''
+    if numpy is not None and isinstance(sizes, numpy.ndarray):
+        return numpy.concatenate((sizes, new_sizes))
+    sizes.extend(new_sizes)
+    return sizes
+
+
+def _insert_sizes(sizes, start, count):
+    '''Inserts `count` zero sizes at `start` and returns the result, which may
+    be a new object.
+    '''
+    if numpy is not None and isinstance(sizes, numpy.ndarray):
+        return numpy.insert(sizes, start, numpy.zeros(count))
+    sizes[start:start] = _new_sizes(
+        'array' if isinstance(sizes, array) else 'list', count)
+    return sizes
+
+
+def _delete_sizes(sizes, start, stop):
+    '''Removes the sizes in `[start, stop)` and returns the result, which may
+    be a new object.
+    '''
+    if numpy is not None and isinstance(sizes, numpy.ndarray):
+        return numpy.delete(sizes, slice(start, stop))
+    del sizes[start:stop]
+    return sizes
+
+
+class _SizeTree(object):
+    '''A Fenwick (binary indexed) tree over the sizes of the items of a
+    layout. It gives the position of an item (the sum of the sizes of the items
+    before it), the item at a position, and updates the size of a single item
+    all in O(log n).
+    '''
+
+    def __init__(self, sizes, storage):
+        n = self.n = len(sizes)
+        self.storage = storage
+        if storage == 'numpy':
+            # node i holds the sum of the sizes in (i - lowbit(i), i], which
+            # is computed in one pass from the prefix sums
+            prefix = numpy.zeros(n + 1, dtype=numpy.float64)
+            numpy.cumsum(sizes, out=prefix[1:])
+            nodes = numpy.arange(1, n + 1)
+            tree = numpy.zeros(n + 1, dtype=numpy.float64)
+            tree[1:] = prefix[1:] - prefix[nodes - (nodes & -nodes)]
+        else:
+            tree = array('d', [0]) if storage == 'array' else [0.]
+            tree.extend(sizes)
+            for i in range(1, n + 1):
+                j = i + (i & -i)
+                if j <= n:
+                    tree[j] += tree[i]
+        self.tree = tree
+        self._top = 1 << n.bit_length() >> 1
+
+    def __len__(self):
+        return self.n
+
+    def position(self, index):
+        '''Returns the sum of the sizes of the first `index` items.
+        '''
+        tree = self.tree
+        pos = 0.
+        while index > 0:
+            pos += tree[index]
+            index &= index - 1
+        return float(pos)
+
+    def total(self):
+        return self.position(self.n)
+
+    def index_at(self, pos):
+        '''Returns the largest `i`, in `[0, n]`, whose :meth:`position` is
+        not larger than `pos`. That is the item on which `pos` falls, or `n`
+        when `pos` is past the end.
+        '''
+        tree = self.tree
+        n = self.n
+        i = 0
+        step = self._top
+        while step:
+            j = i + step
+            if j <= n and tree[j] <= pos:
+                i = j
+                pos -= tree[j]
+            step >>= 1
+        return i
+
+    def add(self, index, delta):
+        '''Adds `delta` to the size of the item at `index`.
+        '''
+        tree = self.tree
+        n = self.n
+        i = index + 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def extend(self, sizes):
+        '''Appends items with the given `sizes`, in O(log n) per item.
+        '''
+        tree = self.tree
+        n = self.n
+        if self.storage == 'numpy':
+            tree = self.tree = numpy.concatenate(
+                (tree, numpy.zeros(len(sizes), dtype=numpy.float64)))
+
+        for size in sizes:
+            n += 1
+            # node n is its size plus the nodes covering (n - lowbit(n), n)
+            stop = n - (n & -n)
+            k = n - 1
+            while k > stop:
+                size += tree[k]
+                k &= k - 1
+            if self.storage == 'numpy':
+                tree[n] = size
+            else:
+                tree.append(size)
+        self.n = n
+        self._top = 1 << n.bit_length() >> 1
+
+    def rebuild(self, sizes, index):
+        '''Recomputes the tree after the `sizes` changed from `index`, e.g.
+        items were inserted or removed.
+        '''
+        self.__init__(sizes, self.storage)
+
+
+class _BlockSizeTree(object):
+    '''The item positions of a layout with the `'list'` or `'array'`
+    :attr:`LinearRecycleLayoutManager.size_storage`. The items are split in
+    blocks of :attr:`block` items, and a :class:`_SizeTree` is kept over the
+    sums of the sizes of the blocks. Positions are found in O(log n) plus a
+    sum over a part of a block, and inserting or removing items only sums
+    again the blocks after them, rather than rebuilding a tree over all the
+    items with python steps.
+
+    It refers to the `sizes` sequence, which is changed in place by the
+    layout manager.
+    '''
+
+    block = 64
+
+    def __init__(self, sizes, storage):
+        self.storage = storage
+        self.sums = []
+        self.rebuild(sizes, 0)
+
+    def __len__(self):
+        return self.n
+
+    def rebuild(self, sizes, index):
+        '''See :meth:`_SizeTree.rebuild`.
+        '''
+        block = self.block
+        first = index // block
+        sums = self.sums
+        del sums[first:]
+        sums.extend(sum(sizes[i:i + block])
+                    for i in range(first * block, len(sizes), block))
+        self.sizes = sizes
+        self.n = len(sizes)
+        self.tree = _SizeTree(sums, 'list')
+
+    def position(self, index):
+        start = index - index % self.block
+        pos = self.tree.position(index // self.block)
+        if index > start:
+            pos += sum(self.sizes[start:index])
+        return float(pos)
+
+    def total(self):
+        return self.tree.total()
+
+    def index_at(self, pos):
+        '''See :meth:`_SizeTree.index_at`.
+        '''
+        tree = self.tree
+        b = tree.index_at(pos)
+        if b >= len(tree):
+            return self.n
+        start = b * self.block
+        block_sizes = self.sizes[start:start + self.block]
+        return start + bisect_right(
+            list(accumulate(block_sizes)), pos - tree.position(b))
+
+    def add(self, index, delta):
+        b = index // self.block
+        self.sums[b] += delta
+        self.tree.add(b, delta)
+
+    def extend(self, sizes):
+        '''Adds the items that were appended to the sizes sequence, which
+        are `sizes`.
+        '''
+        block = self.block
+        all_sizes = self.sizes
+        old = self.n
+        n = self.n = len(all_sizes)
+        b = old // block
+        if old % block:
+            # complete the last block
+            self.add(old, sum(all_sizes[old:min(n, (b + 1) * block)]))
+            b += 1
+        sums = [sum(all_sizes[i:i + block])
+                for i in range(b * block, n, block)]
+        self.sums.extend(sums)
+        self.tree.extend(sums)
+
+
+def _new_size_tree(sizes, storage):
+    '''Returns the tree giving the positions of the items with `sizes`, of
+    the `storage` kind.
+    '''
+    if storage == 'numpy':
+        # rebuilding it is a vectorized O(n)
+        return _SizeTree(sizes, storage)
+    return _BlockSizeTree(sizes, storage)
+
+
+class _IndexRanges(object):
+    '''A sorted set of item indices, kept as disjoint `[start, stop)` ranges,
+    so that a range of any length is added or removed in O(log r) plus the
+    ranges it joins, where r is the number of ranges. It's a read-only
+    sequence of the indices, in order.
+    '''
+
+    def __init__(self):
+        self.starts = []
+        self.stops = []
+        # the number of indices before each range, computed when needed
+        self._counts = None
+
+    def _get_counts(self):
+        counts = self._counts
+        if counts is None:
+            counts = self._counts = [0]
+            counts.extend(accumulate(
+                stop - start for start, stop in zip(self.starts, self.stops)))
+        return counts
+
+    def __len__(self):
+        return self._get_counts()[-1]
+
+    def __contains__(self, index):
+        k = bisect_right(self.starts, index) - 1
+        return k >= 0 and index < self.stops[k]
+
+    def __iter__(self):
+        for start, stop in zip(self.starts, self.stops):
+            for index in range(start, stop):
+                yield index
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+        counts = self._get_counts()
+        if i < 0:
+            i += counts[-1]
+        if not 0 <= i < counts[-1]:
+            raise IndexError('index out of range')
+        k = bisect_right(counts, i) - 1
+        return self.starts[k] + i - counts[k]
+
+    def __repr__(self):
+        return '<_IndexRanges {}>'.format(self.ranges())
+
+    def index(self, index):
+        '''Returns the position of `index` in the set. Raises a `ValueError`
+        if it isn't in the set.
+        '''
+        k = bisect_right(self.starts, index) - 1
+        if k < 0 or index >= self.stops[k]:
+            raise ValueError('{} is not in the set'.format(index))
+        return self._get_counts()[k] + index - self.starts[k]
+
+    def ranges(self, start=0, stop=None):
+        '''Returns the list of `(start, stop)` ranges of the indices in
+        `[start, stop)`.
+        '''
+        starts, stops = self.starts, self.stops
+        lo = bisect_right(stops, start)
+        hi = len(starts) if stop is None else bisect_left(starts, stop)
+        ranges = list(zip(starts[lo:hi], stops[lo:hi]))
+        if ranges:
+            ranges[0] = max(ranges[0][0], start), ranges[0][1]
+            if stop is not None:
+                ranges[-1] = ranges[-1][0], min(ranges[-1][1], stop)
+        return ranges
+
+    def add(self, start, stop):
+        '''Adds the indices in `[start, stop)`.
+        '''
+        if start >= stop:
+            return
+        starts, stops = self.starts, self.stops
+        # the ranges overlapping or touching it are joined with it
+        lo = bisect_left(stops, start)
+        hi = bisect_right(starts, stop)
+        if lo < hi:
+            start = min(start, starts[lo])
+            stop = max(stop, stops[hi - 1])
+        starts[lo:hi] = [start]
+        stops[lo:hi] = [stop]
+        self._counts = None
+
+    def add_indices(self, indices):
+        '''Adds the sorted `indices`.
+        '''
+        start = prev = None
+        for index in indices:
+            if index != prev + 1 if prev is not None else True:
+                if start is not None:
+                    self.add(start, prev + 1)
+                start = index
+            prev = index
+        if start is not None:
+            self.add(start, prev + 1)
+
+    def remove(self, start, stop):
+        '''Removes the indices in `[start, stop)`.
+        '''
+        starts, stops = self.starts, self.stops
+        lo = bisect_right(stops, start)
+        hi = bisect_left(starts, stop)
+        if start >= stop or lo >= hi:
+            return
+        new_starts, new_stops = [], []
+        if starts[lo] < start:
+            new_starts.append(starts[lo])
+            new_stops.append(start)
+        if stops[hi - 1] > stop:
+            new_starts.append(stop)
+            new_stops.append(stops[hi - 1])
+        starts[lo:hi] = new_starts
+        stops[lo:hi] = new_stops
+        self._counts = None
+
+    def clear(self):
+        del self.starts[:]
+        del self.stops[:]
+        self._counts = None
+
+    def insert(self, start, count):
+        '''Shifts the indices from `start` by `count`, for `count` items
+        inserted at `start`, which are not in the set.
+        '''
+        if count <= 0:
+            return
+        starts, stops = self.starts, self.stops
+        k = bisect_left(starts, start)
+        if k and stops[k - 1] > start:
+            # split the range of the items around the inserted ones
+            starts.insert(k, start)
+            stops.insert(k, stops[k - 1])
+            stops[k - 1] = start
+        starts[k:] = [i + count for i in starts[k:]]
+        stops[k:] = [i + count for i in stops[k:]]
+        self._counts = None
+
+    def delete(self, start, stop):
+        '''Removes the indices in `[start, stop)` and shifts back the
+        following ones, for the items removed from `start` to `stop`.
+        '''
+        self.remove(start, stop)
+        starts, stops = self.starts, self.stops
+        count = stop - start
+        k = bisect_left(starts, stop)
+        starts[k:] = [i - count for i in starts[k:]]
+        stops[k:] = [i - count for i in stops[k:]]
+        if 0 < k < len(starts) and stops[k - 1] == starts[k]:
+            stops[k - 1] = stops[k]
+            del starts[k]
+            del stops[k]
+        self._counts = None
+
+
+def _read_flagged(adapter, key, start, stop):
+    '''Returns the indices of the items in `[start, stop)` of the `adapter`
+    whose `key` value is true.
+    '''
+    source = adapter.data_source
+    get_column = getattr(source, 'get_column', None)
+    column = get_column(key) if get_column is not None else None
+    if column is not None:
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            return (numpy.flatnonzero(column[start:stop]) + start).tolist()
+        return [i for i in range(start, stop) if column[i]]
+    if source is None:
+        return [i for i, item in enumerate(
+            islice(adapter.data, start, stop), start) if item.get(key)]
+    return [i for i in range(start, stop) if adapter[i].get(key)]
+
+
+def _changed_ranges(changes, shift):
+    '''Returns the `(start, stop)` ranges, in the final indices, of the items
+    added or modified by the data `changes`, see
+    :meth:`RecycleLayoutManager.update_positions_and_sizes`.
+    `shift(extent, start, stop)` is called for each insert or remove, in
+    order, to update the indices kept by the caller.
+    '''
+    pending = []
+    for extent, start, stop in changes:
+        count = stop - start
+        if extent in ('data_add', 'data_insert'):
+            shift(extent, start, stop)
+            pending = [(r_start + count if r_start >= start else r_start,
+                        r_stop + count if r_stop > start else r_stop)
+                       for r_start, r_stop in pending]
+        elif extent == 'data_remove':
+            shift(extent, start, stop)
+            pending = [
+                (r_start - min(count, r_start - start)
+                 if r_start > start else r_start,
+                 r_stop - min(count, r_stop - start)
+                 if r_stop > start else r_stop)
+                for r_start, r_stop in pending]
+            continue
+        pending.append((start, stop))
+    return pending
+
+
+class _ItemPositions(object):
+    '''Read-only sequence of the item positions of a :class:`_SizeTree`.
+    '''
+
+    def __init__(self, tree):
+        self.tree = tree
+
+    def __len__(self):
+        return len(self.tree) if self.tree is not None else 0
+
+    def __getitem__(self, index):
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError('position index out of range')
+        return self.tree.position(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.tree.position(i)
+
+
+class _UniformSizes(object):
+    '''Stands for both the sizes and the :class:`_SizeTree` of a layout whose
+    `n` items all have the same `size`. Nothing is stored per item, so it is
+    created in constant time whatever the number of items.
+    '''
+
+    storage = None
+
+    def __init__(self, n, size):
+        self.n = n
+        self.size = size
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        n = self.n
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError('size index out of range')
+        return self.size
+
+    def position(self, index):
+        return float(index * self.size)
+
+    def total(self):
+        return float(self.n * self.size)
+
+    def index_at(self, pos):
+        '''See :meth:`_SizeTree.index_at`.
+        '''
+        n = self.n
+        if pos < 0:
+            return 0
+        if self.size <= 0:
+            return n
+        return min(int(pos // self.size), n)
+
+
+def _show_span(rv, orientation, pos, size):
+    '''Scrolls `rv` the least so that the part of its container that starts
+    at `pos`, from the top or the left depending on `orientation`, and is
+    `size` long is visible.
     '''
-    # all keys will be reduced to max_size.
-    max_size = (_max_cache_size // 2) // len(_cached_views)
-    global _cache_count
-    for cls, instances in _cached_views.items():
-        _cache_count -= max(0, len(instances) - max_size)
-        del instances[max_size:]
+    if orientation == "vertical":
+        h = rv.container.height
+        if h <= rv.height:  # all views are visible
+            return
+
+        # convert everything to container coordinates
+        top = h - pos
+        bottom = top - size
+        view_h = h - rv.height
+        view_bot = view_h * min(1, max(rv.scroll_y, 0))
+        view_top = view_bot + rv.height
+
+        if top <= view_top:
+            if bottom >= view_bot:  # it's fully in view
+                return
+            rv.scroll_y = bottom / float(view_h)
+        else:
+            rv.scroll_y = (top - rv.height) / float(view_h)
+    else:
+        w = rv.container.width
+        if w <= rv.width:  # all views are visible
+            return
+
+        # convert everything to container coordinates
+        left = pos
+        right = left + size
+        view_w = w - rv.width
+        view_left = view_w * min(1, max(rv.scroll_x, 0))
+        view_right = view_left + rv.width
+
+        if left >= view_left:
+            if right <= view_right:  # it's fully in view
+                return
+            rv.scroll_x = (right - rv.width) / float(view_w)
+        else:
+            rv.scroll_x = left / float(view_w)
 
 
 class LayoutChangeException(Exception):
@@ -69,8 +744,34 @@ class RecycleViewLayout(Widget):
     As the views' size is controlled by the layout managers, we don't want the
     :RecycleViewLayout children's size/pos changes to cause
     a re-layout, so it inherits from Widget rather than a layout.
+
+    The views kept hidden in it, see :attr:`RecycleAdapter.detach_views`, don't
+    get the touches.
     '''
-    pass
+
+    def on_touch_down(self, touch):
+        if self.disabled and self.collide_point(*touch.pos):
+            return True
+        for child in self.children[:]:
+            if child not in _hidden_views and \
+                    child.dispatch('on_touch_down', touch):
+                return True
+
+    def on_touch_move(self, touch):
+        if self.disabled:
+            return
+        for child in self.children[:]:
+            if child not in _hidden_views and \
+                    child.dispatch('on_touch_move', touch):
+                return True
+
+    def on_touch_up(self, touch):
+        if self.disabled:
+            return
+        for child in self.children[:]:
+            if child not in _hidden_views and \
+                    child.dispatch('on_touch_up', touch):
+                return True
 
 
 class RecycleViewMixin(object):
@@ -83,6 +784,10 @@ class RecycleViewMixin(object):
         '''Called by the :class:`RecycleAdapter` when the view is initially
         populated with the values from the `data` dictionary for this item.
 
+        When not overwritten, the adapter sets the attributes itself and skips
+        those that already have the value, see
+        :attr:`RecycleAdapter.skip_unchanged_attrs`.
+
         :Parameters:
 
             `rv`: :class:`RecycleView` instance
@@ -122,10 +827,715 @@ class RecycleViewMixin(object):
         self.size = size
         self.pos = pos
 
+    def get_measured_size(self, rv, index):
+        '''Called, when the layout manager measures the items (see
+        :attr:`LinearRecycleLayoutManager.auto_size`), after the view was laid
+        out for the item at `index`. It returns the size the view needs in
+        the layout direction, e.g. the height of a label's `texture_size`, or
+        None if it's not known. By default it returns None.
+
+        A size that is only known later, e.g. once the text is rendered, can
+        be given with :meth:`RecycleView.report_view_size`.
+        '''
+        return None
+
     def apply_selection(self, rv, index, is_selected):
         pass
 
 
+class RecycleViewPool(EventDispatcher):
+    '''A size limited cache of views (instances) that are not used and no
+    longer in sync with any data, from which the :class:`RecycleAdapter`
+    takes views before creating new ones.
+
+    Each adapter has its own pool by default. A pool can be shared by several
+    adapters by assigning it to their :attr:`RecycleAdapter.view_pool`, e.g.
+    for screens that show the same viewclasses.
+
+    When the pool is full, the least recently added views are evicted, and
+    removed from their container if they were kept hidden in it, see
+    :attr:`RecycleAdapter.detach_views`.
+    '''
+
+    max_size = NumericProperty(1000)
+    '''The maximum number of views in the pool, all classes together.
+    '''
+    class_limits = DictProperty({})
+    '''A dict whose keys are viewclasses and values the maximum number of
+    views of that class in the pool, in addition to :attr:`max_size`.
+    '''
+
+    hits = 0
+    '''The number of times a view was taken from the pool.
+    '''
+    misses = 0
+    '''The number of times no view of the requested class was in the pool.
+    '''
+    evictions = 0
+    '''The number of views evicted from the pool because of the limits or
+    :meth:`trim`.
+    '''
+
+    def __init__(self, **kwargs):
+        # all the views, least recently added first, and the same per class
+        self._views = OrderedDict()
+        self._class_views = defaultdict(OrderedDict)
+        super(RecycleViewPool, self).__init__(**kwargs)
+
+    def __len__(self):
+        return len(self._views)
+
+    def count(self, viewclass):
+        '''Returns the number of views of `viewclass` in the pool.
+        '''
+        views = self._class_views.get(viewclass)
+        return len(views) if views else 0
+
+    def get_limit(self, viewclass):
+        '''Returns the maximum number of views of `viewclass` in the pool.
+        '''
+        return min(self.class_limits.get(viewclass, self.max_size),
+                   self.max_size)
+
+    def get(self, viewclass):
+        '''Removes and returns the most recently added view of `viewclass`,
+        or None if there's none.
+        '''
+        views = self._class_views.get(viewclass)
+        if not views:
+            self.misses += 1
+            return None
+        self.hits += 1
+        view = views.popitem()[0]
+        del self._views[view]
+        return view
+
+    def add(self, view):
+        '''Adds `view` to the pool, evicting the least recently added views
+        if over the limits.
+        '''
+        viewclass = view.__class__
+        views = self._class_views[viewclass]
+        self._views[view] = viewclass
+        views[view] = None
+
+        limit = self.get_limit(viewclass)
+        while len(views) > limit:
+            view = views.popitem(last=False)[0]
+            del self._views[view]
+            _discard_view(view)
+            self.evictions += 1
+        self.trim(self.max_size)
+
+    def trim(self, target):
+        '''Evicts the least recently added views until at most `target`
+        views are left.
+        '''
+        views = self._views
+        class_views = self._class_views
+        while len(views) > target:
+            view, viewclass = views.popitem(last=False)
+            del class_views[viewclass][view]
+            _discard_view(view)
+            self.evictions += 1
+
+    def clear(self):
+        '''Removes all the views from the pool.
+        '''
+        for view in self._views:
+            _discard_view(view)
+        self._views.clear()
+        self._class_views.clear()
+
+    def on_max_size(self, instance, value):
+        self.trim(value)
+
+    def get_stats(self):
+        '''Returns a dict with the `size` of the pool, the number of `hits`,
+        `misses` and `evictions` and the number of views per class in
+        `classes`.
+        '''
+        return {
+            'size': len(self._views), 'hits': self.hits,
+            'misses': self.misses, 'evictions': self.evictions,
+            'classes': {cls.__name__: len(views)
+                        for cls, views in self._class_views.items() if views}}
+
+
+def _call(name, f, *largs):
+    # RecycleViewStats.time_call, when not counting
+    return f(*largs)
+
+
+class RecycleViewStats(EventDispatcher):
+    '''Counts the work done by a :class:`RecycleView` in its refreshes, to
+    find out why a frame was slow. Nothing is counted until it's assigned to
+    :attr:`RecycleView.stats`.
+
+    :attr:`last` holds the counters of the last refresh, which include the
+    work done since the previous refresh, e.g. prefetching views, and
+    :attr:`total` the sums of all the refreshes since the last :meth:`reset`.
+    Both are dicts with:
+
+    - `refreshes`: the number of refreshes.
+    - `views_created`: the views created.
+    - `views_visible`: the views requested that were already displayed.
+    - `views_dirty`: the views taken from :attr:`RecycleAdapter.dirty_views`
+      that were still synced with their item.
+    - `views_dirty_rebound`: the dirty views synced with another item.
+    - `views_pool`: the views taken from the
+      :attr:`RecycleAdapter.view_pool`, and synced with their item.
+    - `refresh_view_attrs` and `refresh_view_layout`: dicts of the number of
+      views synced with their item, respectively laid out, per viewclass
+      name.
+    - `layout_retries`: the number of times the layout restarted after a
+      :class:`LayoutChangeException`.
+    - `setup_time`, `sizes_time` and `visible_time`: the time, in seconds,
+      spent in :meth:`RecycleLayoutManager.recycleview_setup`, in computing
+      or updating the positions and sizes of the items and in
+      :meth:`RecycleLayoutManager.compute_visible_views`.
+    - `time`: the time of the whole refresh.
+
+    `on_refresh` is dispatched with :attr:`last` after each refresh.
+    '''
+
+    __events__ = ('on_refresh', )
+
+    last = {}
+    total = {}
+
+    def __init__(self, **kwargs):
+        super(RecycleViewStats, self).__init__(**kwargs)
+        self.reset()
+
+    @staticmethod
+    def _new_counters():
+        return {
+            'refreshes': 0, 'views_created': 0, 'views_visible': 0,
+            'views_dirty': 0, 'views_dirty_rebound': 0, 'views_pool': 0,
+            'refresh_view_attrs': {}, 'refresh_view_layout': {},
+            'layout_retries': 0, 'setup_time': 0., 'sizes_time': 0.,
+            'visible_time': 0., 'time': 0.}
+
+    def reset(self):
+        '''Sets all the counters to zero.
+        '''
+        self.last = self._new_counters()
+        self.total = self._new_counters()
+        self._current = self._new_counters()
+
+    def count(self, name):
+        '''(internal) Adds one to the `name` counter, e.g. `'views_pool'`.
+        '''
+        self._current[name] += 1
+
+    def count_class(self, name, viewclass):
+        '''(internal) Counts a call of `name` for a view of `viewclass`.
+        '''
+        counts = self._current[name]
+        key = viewclass.__name__
+        counts[key] = counts.get(key, 0) + 1
+
+    def time_call(self, name, f, *largs):
+        '''(internal) Calls `f` with `largs` and adds its duration to the
+        `name` time.
+        '''
+        t = default_timer()
+        try:
+            return f(*largs)
+        finally:
+            self._current[name] += default_timer() - t
+
+    def end_refresh(self, duration):
+        '''(internal) Ends the counters of a refresh that took `duration`,
+        adds them to :attr:`total` and dispatches `on_refresh`.
+        '''
+        last = self.last = self._current
+        self._current = self._new_counters()
+        last['refreshes'] = 1
+        last['time'] = duration
+        total = self.total
+        for key, value in last.items():
+            if isinstance(value, dict):
+                counts = total[key]
+                for name, count in value.items():
+                    counts[name] = counts.get(name, 0) + count
+            else:
+                total[key] += value
+        self.dispatch('on_refresh', last)
+
+    def on_refresh(self, counters):
+        pass
+
+
+def _describe_view_call(largs, view):
+    # args of the traced calls that take an index and return its view
+    return {'index': largs[0], 'viewclass': view.__class__.__name__}
+
+
+def _describe_widget_call(largs, result):
+    # args of the traced calls whose first argument is a view
+    return {'viewclass': largs[0].__class__.__name__}
+
+
+# the methods that are traced, by the name of the RecycleView property whose
+# value has them, with the function returning the args of an event from the
+# call args and result
+_trace_hooks = (
+    ('adapter', 'get_view', _describe_view_call),
+    ('adapter', 'create_view', _describe_view_call),
+    ('adapter', 'refresh_view_attrs', lambda largs, result: {
+        'index': largs[0], 'viewclass': largs[1].__class__.__name__}),
+    ('layout_manager', 'recycleview_setup', None),
+    ('layout_manager', 'compute_positions_and_sizes', lambda largs, result: {
+        'append': largs[0]}),
+    ('layout_manager', 'update_positions_and_sizes', lambda largs, result: {
+        'changes': len(largs[0])}),
+    ('layout_manager', 'compute_visible_views', None),
+    ('container', 'add_widget', _describe_widget_call),
+    ('container', 'remove_widget', _describe_widget_call),
+)
+
+
+class RecycleViewTracer(object):
+    '''Base class of the tracers that receive the timings of the hot paths
+    of a :class:`RecycleView`, see :attr:`RecycleView.tracer`. Subclasses
+    implement :meth:`add_event`, e.g. to forward them to another profiler.
+
+    The traced calls are the whole refreshes, the adapter's `get_view`,
+    `create_view` and `refresh_view_attrs`, the layout manager's
+    `recycleview_setup`, `compute_positions_and_sizes`,
+    `update_positions_and_sizes` and `compute_visible_views`, and the
+    container's `add_widget` and `remove_widget`.
+    '''
+
+    def add_event(self, name, start, duration, args):
+        '''Called after each traced call. `name` is the class and method
+        names, e.g. `'RecycleAdapter.get_view'`, `start` and `duration` are
+        in seconds, from :func:`timeit.default_timer`, and `args` is None or
+        a dict describing the call, e.g. with the index and viewclass name.
+        '''
+        pass
+
+    def wrap(self, name, f, describe=None):
+        '''Returns a function calling `f` and adding its event. `describe`,
+        if not None, returns the args of the event from the positional
+        arguments of the call and its result.
+        '''
+        add_event = self.add_event
+
+        def traced(*largs, **kwargs):
+            result = None
+            start = default_timer()
+            try:
+                result = f(*largs, **kwargs)
+                return result
+            finally:
+                duration = default_timer() - start
+                add_event(name, start, duration,
+                          describe(largs, result) if describe else None)
+        return traced
+
+
+class RecycleViewTraceBuffer(RecycleViewTracer):
+    '''A tracer keeping the last :attr:`max_events` events in memory, which
+    can be saved in the Chrome trace event format with :meth:`save`, and
+    opened in `chrome://tracing` or Perfetto to see, e.g., which viewclass
+    or layout phase made a frame slow.
+    '''
+
+    max_events = 100000
+    '''The number of events kept, the oldest ones are dropped.
+    '''
+
+    def __init__(self, max_events=None):
+        super(RecycleViewTraceBuffer, self).__init__()
+        if max_events is not None:
+            self.max_events = max_events
+        self.events = deque(maxlen=self.max_events)
+        self._tid = threading.current_thread().ident
+
+    def add_event(self, name, start, duration, args):
+        self.events.append((name, start, duration, args))
+
+    def clear(self):
+        self.events.clear()
+
+    def get_trace_events(self):
+        '''Returns the events as a list of Chrome trace events (dicts).
+        '''
+        pid = os.getpid()
+        tid = self._tid
+        trace = []
+        for name, start, duration, args in self.events:
+            event = {
+                'name': name, 'cat': 'recycleview', 'ph': 'X',
+                'ts': start * 1e6, 'dur': duration * 1e6, 'pid': pid,
+                'tid': tid}
+            if args:
+                event['args'] = args
+            trace.append(event)
+        return trace
+
+    def save(self, filename):
+        '''Writes the events to `filename`, as Chrome trace event JSON.
+        '''
+        with open(filename, 'w') as f:
+            json.dump({'traceEvents': self.get_trace_events(),
+                       'displayTimeUnit': 'ms'}, f)
+
+
+class RecycleDataSource(EventDispatcher):
+    '''Base class for the data sources that can be used instead of a list of
+    dicts, see :attr:`RecycleAdapter.data_source`.
+
+    A source only has to implement :meth:`__len__` and :meth:`__getitem__`,
+    which returns the dict of the item at an index. The adapter only requests
+    the items whose view is displayed or prefetched, so they can be built
+    lazily, e.g. from a file or a database.
+
+    A source may also implement `get_item_size(index)` and
+    `get_item_viewclass(index)`, which are then used instead of
+    :attr:`RecycleLayoutManager.key_size` and
+    :attr:`RecycleAdapter.key_viewclass` so that the dict of every item is not
+    built for the layout. `get_item_size` may return None for the default
+    size and `get_item_viewclass` a class or its name. A source that stores
+    its data by column can instead implement `get_column(key)`, see
+    :class:`RecycleColumnDataSource`. When a source gives no sizes and no
+    `key_size` is set, all the items have the default size and the layout is
+    computed in constant time. Finally, `set_visible_range(start, stop)` is
+    called with the range of the displayed items whenever the adapter gets
+    the views, e.g. to load them ahead, see :class:`RecyclePagedDataSource`.
+
+    When its data changes, the source must dispatch `on_data_changed` with
+    the arguments of :meth:`RecycleAdapter.on_data_changed`, e.g.
+    `source.dispatch('on_data_changed', extent='data_modified', start=3,
+    stop=4)`.
+
+    :Events:
+        `on_data_changed`:
+            Fired when the data of the source changes.
+    '''
+
+    __events__ = ('on_data_changed', )
+
+    def __len__(self):
+        raise NotImplementedError()
+
+    def __getitem__(self, index):
+        '''Returns the dict of the item at `index`.
+        '''
+        raise NotImplementedError()
+
+    def on_data_changed(self, extent, start=None, stop=None):
+        pass
+
+
+class RecycleColumnDataSource(RecycleDataSource):
+    '''A :class:`RecycleDataSource` that stores the data by column instead of
+    a dict per item. `columns` is a dict whose keys are the keys of the items
+    and values the sequence of the values of all the items for that key, e.g.
+    a list, an :class:`array.array` or a numpy array. All the columns must
+    have the same length.
+
+    The dict of an item is only built when its view is synced. A None value
+    means that the item has no such key, e.g. for the items whose viewclass
+    does not have the attribute. Strings repeated in a column should be the
+    same object, e.g. with :func:`sys.intern`, to be stored only once.
+
+    The layout manager reads the sizes from the
+    :attr:`RecycleLayoutManager.key_size` column without building the items,
+    see :meth:`get_column`.
+    '''
+
+    columns = {}
+    '''The dict of the columns. It is read-only, use :meth:`set_columns`,
+    :meth:`set_values` or :meth:`extend` to change the data.
+    '''
+
+    def __init__(self, columns=None, **kwargs):
+        super(RecycleColumnDataSource, self).__init__(**kwargs)
+        self._set_columns(columns or {})
+
+    def _set_columns(self, columns):
+        lengths = set(len(column) for column in columns.values())
+        if len(lengths) > 1:
+            raise ValueError('The columns must all have the same length')
+        self.columns = dict(columns)
+        self._n = lengths.pop() if lengths else 0
+        # numpy's item returns python values, which the properties accept
+        self._getters = [
+            (key, column.item if numpy is not None and
+             isinstance(column, numpy.ndarray) else column.__getitem__)
+            for key, column in self.columns.items()]
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, index):
+        n = self._n
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError('item index out of range')
+        item = {}
+        for key, get in self._getters:
+            value = get(index)
+            if value is not None:
+                item[key] = value
+        return item
+
+    def get_column(self, key):
+        '''Returns the column of `key`, or None if there's no such column.
+        '''
+        return self.columns.get(key)
+
+    def set_columns(self, columns):
+        '''Replaces all the columns with those of the dict `columns`.
+        '''
+        self._set_columns(columns)
+        self.dispatch('on_data_changed', extent='data')
+
+    def set_values(self, index, **values):
+        '''Changes the values of the item at `index`, e.g.
+        `source.set_values(3, contact_name='Mark')`. Each key must already
+        have a column.
+        '''
+        columns = self.columns
+        for key in values:
+            if key not in columns:
+                raise KeyError('There is no {} column'.format(key))
+        for key, value in values.items():
+            columns[key][index] = value
+        if index < 0:
+            index += self._n
+        self.dispatch(
+            'on_data_changed', extent='data_modified', start=index,
+            stop=index + 1)
+
+    def extend(self, columns):
+        '''Appends the items given as a dict of columns, with the same keys
+        as :attr:`columns` unless the source is empty.
+        '''
+        current = self.columns
+        start = self._n
+        if not current:
+            new_columns = columns
+        elif set(columns) != set(current):
+            raise ValueError('The columns must have the keys of the source')
+        else:
+            new_columns = {}
+            for key, column in current.items():
+                if numpy is not None and isinstance(column, numpy.ndarray):
+                    column = numpy.concatenate((column, columns[key]))
+                else:
+                    column.extend(columns[key])
+                new_columns[key] = column
+        self._set_columns(new_columns)
+        self.dispatch(
+            'on_data_changed', extent='data_add', start=start, stop=self._n)
+
+
+class RecyclePagedDataSource(RecycleDataSource):
+    '''A :class:`RecycleDataSource` that loads its items by pages, on worker
+    threads, so that e.g. a database query does not block the UI.
+
+    `fetch_page` is called on a worker thread as `fetch_page(start, stop)`
+    and must return the list of the dicts of the items in `[start, stop)`. It
+    should open its own database connection, e.g. a sqlite3 connection can't
+    be shared between threads. `count` is the number of items.
+
+    The pages of the displayed items and of the items within :attr:`margin`
+    are requested whenever the adapter gets the views. A page is only
+    requested once at a time, and the requests of the pages that are no
+    longer needed are cancelled if not started yet. Until its page is loaded
+    an item is a copy of :attr:`placeholder`, shown with
+    :attr:`placeholder_viewclass`. When a page is loaded, only the views of
+    its items are updated.
+
+    The items all have the default size of the layout manager. Its
+    `key_size` must not be set, as it would read all the items and so load
+    all the pages.
+    '''
+
+    page_size = NumericProperty(100)
+    '''The number of items in a page.
+    '''
+
+    margin = NumericProperty(100)
+    '''The number of items before and after the displayed items whose pages
+    are loaded ahead.
+    '''
+
+    max_pages = NumericProperty(20)
+    '''The number of pages kept loaded. When more pages are loaded, the least
+    recently used ones are dropped and will be requested again if needed. It
+    should be larger than the number of pages covering the displayed items and
+    the :attr:`margin`.
+    '''
+
+    max_workers = NumericProperty(2)
+    '''The number of worker threads calling `fetch_page`. It is read when
+    the first page is requested.
+    '''
+
+    placeholder = DictProperty({})
+    '''The data of the items whose page is not loaded yet.
+    '''
+
+    placeholder_viewclass = ObjectProperty(None, allownone=True)
+    '''The viewclass, or its name, of the items whose page is not loaded
+    yet. If None, the viewclass of the adapter is used.
+    '''
+
+    def __init__(self, fetch_page, count=0, **kwargs):
+        self.fetch_page = fetch_page
+        self.count = count
+        self._pages = OrderedDict()
+        self._loading = {}
+        self._executor = None
+        # incremented by reset, so pages fetched before are dropped
+        self._generation = 0
+        super(RecyclePagedDataSource, self).__init__(**kwargs)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        count = self.count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('item index out of range')
+        page_size = int(self.page_size)
+        page = index // page_size
+        pages = self._pages
+        if page in pages:
+            rows = pages[page]
+            # it's the most recently used
+            del pages[page]
+            pages[page] = rows
+            offset = index - page * page_size
+            if offset < len(rows):
+                return rows[offset]
+            # fetch_page returned fewer rows than asked
+            return dict(self.placeholder)
+        self.request_pages(page, page + 1)
+        return dict(self.placeholder)
+
+    def get_item_viewclass(self, index):
+        page_size = int(self.page_size)
+        rows = self._pages.get(index // page_size)
+        if rows is not None and index % page_size < len(rows):
+            return None
+        return self.placeholder_viewclass
+
+    def is_loaded(self, index):
+        '''Returns whether the page of the item at `index` is loaded.
+        '''
+        return index // int(self.page_size) in self._pages
+
+    def set_visible_range(self, start, stop):
+        '''Requests the pages of the items in `[start, stop)` and within
+        :attr:`margin` of them, and cancels the requests of the other pages
+        that did not start yet.
+        '''
+        page_size = int(self.page_size)
+        margin = int(self.margin)
+        first = max(0, start - margin) // page_size
+        last = (min(self.count, stop + margin) - 1) // page_size + 1
+        loading = self._loading
+        for page in [p for p in loading if not first <= p < last]:
+            if loading[page].cancel():
+                del loading[page]
+        self.request_pages(first, last)
+
+    def request_pages(self, first, last):
+        '''Requests the pages in `[first, last)` that are not loaded or
+        being loaded.
+        '''
+        pages = self._pages
+        loading = self._loading
+        page_size = int(self.page_size)
+        count = self.count
+        for page in range(first, last):
+            if page in pages or page in loading:
+                continue
+            start = page * page_size
+            stop = min(count, start + page_size)
+            if start >= stop:
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(int(self.max_workers))
+            future = loading[page] = self._executor.submit(
+                self.fetch_page, start, stop)
+            future.add_done_callback(
+                partial(self._schedule_page, self._generation, page))
+
+    def _schedule_page(self, generation, page, future):
+        # called from the worker thread, the page is handled in the ui thread
+        if not future.cancelled():
+            Clock.schedule_once(
+                partial(self._page_loaded, generation, page, future))
+
+    def _page_loaded(self, generation, page, future, *largs):
+        if generation != self._generation:
+            return
+        if self._loading.get(page) is future:
+            del self._loading[page]
+        try:
+            rows = future.result()
+        except Exception:
+            Logger.exception(
+                'RecyclePagedDataSource: Failed to load page {}'.format(page))
+            return
+
+        page_size = int(self.page_size)
+        start = page * page_size
+        stop = min(self.count, start + page_size)
+        if len(rows) != stop - start:
+            # e.g. the table changed, the missing items stay placeholders
+            Logger.warning(
+                'RecyclePagedDataSource: Page {} has {} items instead of {}'.
+                format(page, len(rows), stop - start))
+            rows = rows[:stop - start]
+
+        pages = self._pages
+        pages[page] = rows
+        while len(pages) > max(1, int(self.max_pages)):
+            pages.popitem(last=False)
+        self.dispatch(
+            'on_data_changed', extent='data_modified', start=start, stop=stop)
+
+    def reset(self, count=None):
+        '''Drops all the loaded pages and cancels the requests, e.g. after
+        the database changed. If not None, `count` is the new number of items.
+        '''
+        self._generation += 1
+        for future in self._loading.values():
+            future.cancel()
+        self._loading = {}
+        self._pages.clear()
+        if count is not None:
+            self.count = count
+        self.dispatch('on_data_changed', extent='data')
+
+    def on_page_size(self, instance, value):
+        if self._pages or self._loading:
+            self.reset()
+
+    def close(self):
+        '''Cancels the requests and stops the worker threads.
+        '''
+        self._generation += 1
+        for future in self._loading.values():
+            future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._loading = {}
+
+
 class RecycleAdapter(EventDispatcher):
     """
     Adapter provides a binding between the data and the view objects that
@@ -140,26 +1550,139 @@ class RecycleAdapter(EventDispatcher):
     '''See :attr:`RecyclerView.data`. The data for a item at index `i` can
     also be accessed with :class:`RecycleAdapter` `[i]`.
     '''
+    data_source = ObjectProperty(None, allownone=True)
+    '''An object that gives the data instead of :attr:`data` when not None.
+    It only needs `__len__` and `__getitem__`, see :class:`RecycleDataSource`.
+    Sources that are not :class:`~kivy.event.EventDispatcher` cannot notify
+    their changes, which then have to be passed to
+    :meth:`RecycleView.ask_refresh_from_data`.
+    '''
     viewclass = ObjectProperty()
     '''See :attr:`RecyclerView.viewclass`.
     '''
     key_viewclass = StringProperty()
     '''See :attr:`RecyclerView.key_viewclass`.
     '''
+    key_id = StringProperty()
+    '''See :attr:`RecyclerView.key_id`.
+    '''
+    skip_unchanged_attrs = BooleanProperty(True)
+    '''When a view is synced with an item, only set the attributes whose value
+    differs from the data the view was last synced with. It does not apply to
+    views that override :meth:`RecycleViewMixin.refresh_view_attrs`, which
+    always get the full data dict.
+
+    It assumes the attributes that come from the data are only set by the
+    adapter. If a view changes one of them itself, e.g. the `state` of a
+    toggle button, it should be disabled or the view should
+    override :meth:`RecycleViewMixin.refresh_view_attrs`.
+    '''
+
+    view_pool = ObjectProperty(None)
+    '''The :class:`RecycleViewPool` of the views that are not used. Each
+    adapter gets its own pool, but the same pool can be assigned to several
+    adapters to share the views.
+    '''
+
+    detach_views = BooleanProperty(True)
+    '''Whether the views that are no longer displayed are removed from the
+    :attr:`RecycleView.container`, the default.
+
+    When False, they stay children of the container, hidden: their canvas is
+    removed from the container's, so they're not drawn, and the container, if
+    it's a :class:`RecycleViewLayout`, doesn't pass them the touches. Their
+    canvas is added back when they're displayed again. Once enough views exist,
+    scrolling then doesn't change the widget tree, saving the canvas updates
+    and the parent and children events of removing and adding widgets. The
+    views evicted from the :attr:`view_pool` are removed from the container.
+    '''
+
+    creation_budget = NumericProperty(0)
+    '''The time, in seconds, that :meth:`get_views` may spend creating and
+    syncing views in one frame, or 0 for no limit.
+
+    Once over budget, the visible items whose view is not already synced are
+    left blank and the view is created in the following frames. At least one
+    view is created in each frame.
+    '''
+
+    deferred_views = 0
+    '''The number of visible items left without a view by the last
+    :meth:`get_views` because of :attr:`creation_budget`.
+    '''
+
+    prefetch_budget = NumericProperty(.004)
+    '''The time, in seconds, that may be spent in each frame creating and
+    syncing the views requested with :meth:`prefetch_views`, and separately
+    creating the views requested with :meth:`prewarm_views`.
+    '''
+
+    prewarm = DictProperty({})
+    '''A dict whose keys are viewclasses, or their names, and values the
+    number of views of that class to create in the cache ahead of time, see
+    :meth:`prewarm_views`. E.g. `prewarm: {'ContactItem': 20}` in kv, also
+    under a :class:`RecycleView`, see :attr:`RecycleView.prewarm`.
+    '''
+
+    prewarm_time = NumericProperty(0)
+    '''The time, in seconds, spent creating the views of the current or last
+    prewarming, see :meth:`prewarm_views`.
+    '''
+
+    attrs_applied = 0
+    '''The number of view attributes set when syncing the views with the
+    data. Together with :attr:`attrs_skipped` it can be used to measure the
+    effect of :attr:`skip_unchanged_attrs`. They can be reset to zero.
+    '''
+    attrs_skipped = 0
+    '''The number of view attributes not set when syncing the views with the
+    data, because they already had the value, see :attr:`attrs_applied`.
+    '''
 
     # internals
     views = {}  # current displayed items
     # items whose attrs, except for pos/size is still accurate
     dirty_views = defaultdict(dict)
     recycleview = None
+    # the data list, its length and last_op, as seen by the last on_data
+    _last_data = None
+    _last_len = 0
+    _last_op = None
+    _bound_source = None
+    # the RecycleViewStats of the recycleview, when counting
+    _stats = None
 
-    __events__ = ("on_data_changed", )
+    __events__ = ("on_data_changed", "on_prewarm_done")
+
+    def __init__(self, **kwargs):
+        self.views = {}
+        self.dirty_views = defaultdict(dict)
+        # set first, as other properties may need it
+        pool = kwargs.pop('view_pool', None)
+        if pool is None:
+            pool = RecycleViewPool()
+        self.view_pool = pool
+        self._prefetch_indices = []
+        self._prefetch_wanted = set()
+        self._prefetch_trigger = Clock.create_trigger(self._prefetch)
+        self._prewarm_queue = []
+        self._prewarm_trigger = Clock.create_trigger(self._prewarm)
+        super(RecycleAdapter, self).__init__(**kwargs)
 
     def __getitem__(self, index):
         """Return the data entry at `index`
         """
+        source = self.data_source
+        if source is not None:
+            return source[index]
         return self.data[index]
 
+    def __len__(self):
+        source = self.data_source
+        if source is not None:
+            return len(source)
+        return len(self.data)
+
     @property
     def observable_dict(self):
         '''See :meth:`RecyclerView.observable_dict`.
@@ -171,6 +1694,8 @@ class RecycleAdapter(EventDispatcher):
 
     def detach_recycleview(self):
         self.recycleview = None
+        # the layout manager asks again for the prefetching once attached
+        self.prefetch_views([])
 
     def create_view(self, index, viewclass=None):
         """Creates and initializes the view for the data at `index`. The
@@ -186,14 +1711,9 @@ class RecycleAdapter(EventDispatcher):
         # work for kv-declared classes, and might lead the user to think it can
         # work for reloading as well.
         view = viewclass()
-        if viewclass not in _view_base_cache:
-            _view_base_cache[viewclass] = isinstance(view, RecycleViewMixin)
-
-        if _view_base_cache[viewclass]:
-            view.refresh_view_attrs(self.recycleview, item)
-        else:
-            for key, value in item.items():
-                setattr(view, key, value)
+        if self._stats is not None:
+            self._stats.count('views_created')
+        self.refresh_view_attrs(index, view, item)
         return view
 
     def get_view(self, index):
@@ -202,69 +1722,163 @@ class RecycleAdapter(EventDispatcher):
         The returned view is synced with the data, except for the pos/size
         properties.
         """
+        stats = self._stats
         if index in self.views:
+            if stats is not None:
+                stats.count('views_visible')
             return self.views[index]
 
         dirty_views = self.dirty_views
         viewclass = self.get_viewclass(index)
         if viewclass is None:
             return
-        rv = self.recycleview
         stale = False
         view = None
+        source = 'views_pool'
 
         if viewclass in dirty_views:
             dirty_class = dirty_views[viewclass]
             if index in dirty_class:
                 # we found ourself in the dirty list, no need to update data!
                 view = dirty_class.pop(index)
-            elif _cached_views[viewclass]:
-                # global cache has this class, update data
-                view, stale = _cached_views[viewclass].pop(), True
-            elif dirty_class:
-                # random any dirty view element - update data
-                view, stale = dirty_class.popitem()[1], True
-        elif _cached_views[viewclass]:
-            # global cache has this class, update data
-            view, stale = _cached_views[viewclass].pop(), True
+                source = 'views_dirty'
+            else:
+                # the pool may have this class, update data
+                view = self.view_pool.get(viewclass)
+                stale = view is not None
+                if view is None and dirty_class:
+                    # the oldest dirty view element, likely the furthest away
+                    # from the viewport (and not a prefetched one) - update
+                    # data
+                    view = dirty_class.pop(next(iter(dirty_class)))
+                    stale = True
+                    source = 'views_dirty_rebound'
+        else:
+            # the pool may have this class, update data
+            view = self.view_pool.get(viewclass)
+            stale = view is not None
 
         if view is None:
             # create a fresh one
             view = self.create_view(index, viewclass)
+        elif stats is not None:
+            stats.count(source)
 
         if stale is True:
-            item = self[index]
-            if viewclass not in _view_base_cache:
-                _view_base_cache[viewclass] = isinstance(view,
-                                                         RecycleViewMixin)
+            self.refresh_view_attrs(index, view)
 
-            if _view_base_cache[viewclass]:
-                view.refresh_view_attrs(rv, item)
-            else:
+        self.views[index] = view
+        return view
+
+    def refresh_view_attrs(self, index, view, item=None):
+        '''(internal) Syncs the view with the data at `index`, except for the
+        pos/size properties.
+        '''
+        if item is None:
+            item = self[index]
+        viewclass = view.__class__
+        if viewclass not in _view_attrs_cache:
+            _view_attrs_cache[viewclass] = isinstance(
+                view, RecycleViewMixin) and viewclass.refresh_view_attrs is \
+                not RecycleViewMixin.refresh_view_attrs
+
+        if self._stats is not None:
+            self._stats.count_class('refresh_view_attrs', viewclass)
+        if _view_attrs_cache[viewclass]:
+            view.refresh_view_attrs(self.recycleview, item)
+        else:
+            bound = _view_data.get(view) if self.skip_unchanged_attrs \
+                else None
+            if bound is None:
                 for key, value in item.items():
                     setattr(view, key, value)
-
-        self.views[index] = view
+                self.attrs_applied += len(item)
+            else:
+                applied = 0
+                for key, value in item.items():
+                    if key not in bound or bound[key] != value:
+                        setattr(view, key, value)
+                        applied += 1
+                self.attrs_applied += applied
+                self.attrs_skipped += len(item) - applied
+        _view_data[view] = dict(item)
+
+    def get_pinned_view(self, index, view=None):
+        '''Returns a view synced with the data at `index` that is not one of
+        the displayed :attr:`views`, e.g. for a sticky header. `view`, an
+        unparented view previously returned, is reused if its class is right
+        or else added to the :attr:`view_pool`.
+        '''
+        viewclass = self.get_viewclass(index)
+        if view is not None and view.__class__ is not viewclass:
+            self._cache_view(view)
+            view = None
+        if view is None:
+            view = self.view_pool.get(viewclass)
+            if view is None:
+                return self.create_view(index, viewclass)
+            if self._stats is not None:
+                self._stats.count('views_pool')
+        _show_view(view)
+        self.refresh_view_attrs(index, view)
         return view
 
     def get_viewclass(self, index):
         """Get the class type used to create the view from the data at `index`.
         """
         viewclass = None
-        if self.key_viewclass:
+        get_item_viewclass = getattr(
+            self.data_source, 'get_item_viewclass', None)
+        if get_item_viewclass is not None:
+            viewclass = get_item_viewclass(index)
+            if isinstance(viewclass, string_types):
+                viewclass = getattr(Factory, viewclass)
+        if viewclass is None and self.key_viewclass:
             viewclass = self[index].get(self.key_viewclass)
             viewclass = getattr(Factory, viewclass)
         if viewclass is None:
             viewclass = self.viewclass
         return viewclass
 
+    def hide_view(self, view):
+        '''(internal) Removes `view`, which is no longer displayed, from the
+        container, or hides it there, see :attr:`detach_views`.
+        '''
+        if self.detach_views:
+            if view.parent is not None:
+                view.parent.remove_widget(view)
+        else:
+            _hide_view(view)
+
+    def show_view(self, view):
+        '''(internal) Adds `view`, laid out to be displayed, to the
+        container, or shows it again if it's hidden there.
+        '''
+        container = self.recycleview.container
+        parent = view.parent
+        if parent is not container:
+            if parent is not None:
+                # hidden in another container sharing the pool
+                _show_view(view)
+                parent.remove_widget(view)
+            container.add_widget(view)
+        _show_view(view)
+
+    def on_detach_views(self, instance, value):
+        rv = self.recycleview
+        if value and rv is not None and rv.container is not None:
+            container = rv.container
+            for view in [w for w in container.children if w in _hidden_views]:
+                _show_view(view)
+                container.remove_widget(view)
+
     def make_view_dirty(self, view, index):
         """(internal) Used to flag the view as dirty, ready to be used for
         others. A dirty view can be reused by the same index by just changing
         the pos/size. So it's assumed that while in dirty cache the view stays
         in sync with the data. Once the underlying data of this index changes,
         the view will be removed from the dirty views as well and moved to the
-        global cahce.
+        view pool.
         """
         self.dirty_views[view.__class__][index] = view
 
@@ -281,31 +1895,150 @@ class RecycleAdapter(EventDispatcher):
         self.views = {}
 
     def invalidate(self):
-        """Moves all the current views into the global cache. As opposed to
+        """Moves all the current views into the view pool. As opposed to
         making a view dirty, this will completely disconnect the view from the
         data, as it is assumed the data has gone out of sync with the view.
         """
         views = self.views
         if not views:
             return
-        global _cache_count
-        remove = self.recycleview.container.remove_widget
+        hide_view = self.hide_view
         for view in views.values():
-            remove(view)
-            _cached_views[view.__class__].append(view)
-            _cache_count += 1
-
-        if _cache_count >= _max_cache_size:
-            _clean_cache()
+            hide_view(view)
+            self._cache_view(view)
+        for dirty_class in self.dirty_views.values():
+            for view in dirty_class.values():
+                self._cache_view(view)
         self.views = {}
         self.dirty_views.clear()
+        self.prefetch_views([])
+
+    def reuse_views_by_key(self, data):
+        '''Re-keys the current and dirty views to the index in `data` of the
+        item with the same :attr:`key_id` value as the item they were synced
+        with, when that item did not change. The other views are moved to the
+        view pool. Returns False, without doing anything, if there are no
+        views to reuse.
+        '''
+        key_id = self.key_id
+        views = self.views
+        dirty_views = self.dirty_views
+        if not views and not any(dirty_views.values()):
+            return False
+
+        # only look for the keys of the items the views are synced with
+        wanted = set()
+        for view in chain(views.values(), *[
+                dirty_class.values() for dirty_class in dirty_views.values()]):
+            bound = _view_data.get(view)
+            if bound is not None and bound.get(key_id) is not None:
+                wanted.add(bound[key_id])
+
+        indices = {}
+        remaining = len(wanted)
+        for index, item in enumerate(data):
+            if not remaining:
+                break
+            key = item.get(key_id)
+            if key in wanted and key not in indices:
+                indices[key] = index
+                remaining -= 1
+
+        def new_index(view):
+            bound = _view_data.get(view)
+            if bound is None:
+                return None
+            index = indices.get(bound.get(key_id))
+            if index is None or index in used or data[index] != bound:
+                return None
+            used.add(index)
+            return index
+
+        used = set()
+        new_views = {}
+        new_dirty_views = defaultdict(dict)
+        hide_view = self.hide_view
+        for view in views.values():
+            index = new_index(view)
+            if index is None:
+                hide_view(view)
+                self._cache_view(view)
+            else:
+                new_views[index] = view
+
+        for viewclass, dirty_class in dirty_views.items():
+            for view in dirty_class.values():
+                index = new_index(view)
+                if index is None:
+                    self._cache_view(view)
+                else:
+                    new_dirty_views[viewclass][index] = view
+
+        self.views = new_views
+        self.dirty_views = new_dirty_views
+        return True
+
+    def _cache_view(self, view):
+        '''Adds a view, no longer in sync with any data, to the
+        :attr:`view_pool`.
+        '''
+        self.view_pool.add(view)
+
+    def _shift_views(self, start, count):
+        '''Re-keys the current and dirty views whose index is at least `start`
+        by `count`, after items were inserted or removed before them.
+        '''
+        def shift(views):
+            return {i + count if i >= start else i: view
+                    for i, view in views.items()}
 
-    def get_views(self, i_start, i_end):
+        self.views = shift(self.views)
+        dirty_views = self.dirty_views
+        for viewclass, views in list(dirty_views.items()):
+            dirty_views[viewclass] = shift(views)
+
+    def _release_views(self, start, stop):
+        '''Moves all the views of the items in `[start, stop)` to the view
+        pool.
+        '''
+        views = self.views
+        for index in [i for i in views if start <= i < stop]:
+            view = views.pop(index)
+            self.hide_view(view)
+            self._cache_view(view)
+
+        for dirty_class in self.dirty_views.values():
+            for index in [i for i in dirty_class if start <= i < stop]:
+                self._cache_view(dirty_class.pop(index))
+
+    def refresh_views_range(self, start, stop):
+        '''Updates the views of the items in `[start, stop)` after their data
+        changed. Displayed views whose viewclass did not change are re-synced
+        in place, the other views are moved to the view pool.
+        '''
+        views = self.views
+        for dirty_class in self.dirty_views.values():
+            for index in [i for i in dirty_class if start <= i < stop]:
+                self._cache_view(dirty_class.pop(index))
+
+        for index in [i for i in views if start <= i < stop]:
+            view = views[index]
+            if self.get_viewclass(index) is view.__class__:
+                self.refresh_view_attrs(index, view)
+            else:
+                del views[index]
+                self.hide_view(view)
+                self._cache_view(view)
+
+    def get_views(self, i_start, i_end, indices=None):
         '''Gets a 2-tuple of the new and old views for the current viewport.
         The new views are synced to the data except for the size/pos
         properties.
         The old views need to be removed from the layout, and the new views
         added.
+
+        The visible items are those from `i_start` to `i_end`, or if not None
+        those of `indices`, in that range, when not all of them are visible.
         '''
         current_views = self.views
         visible_views = {}
@@ -313,10 +2046,30 @@ class RecycleAdapter(EventDispatcher):
         dirty_views = self.dirty_views
         get_view = self.get_view
         make_view_dirty = self.make_view_dirty
+        budget = self.creation_budget
+        deadline = default_timer() + budget if budget else None
+        deferred = 0
+
+        set_visible_range = getattr(
+            self.data_source, 'set_visible_range', None)
+        if set_visible_range is not None:
+            set_visible_range(i_start, i_end + 1)
 
         # iterate though the visible view
         # add them into the container if not already done
-        for index in range(i_start, i_end + 1):
+        if indices is None:
+            indices = range(i_start, i_end + 1)
+        # the views taken that were not displayed, at least one is taken
+        taken = 0
+        for index in indices:
+            if deadline is not None and index not in current_views:
+                if taken and default_timer() > deadline:
+                    # over budget, only take the views that are already synced
+                    viewclass = self.get_viewclass(index)
+                    if index not in dirty_views.get(viewclass, ()):
+                        deferred += 1
+                        continue
+                taken += 1
             view = get_view(index)
             if not view:
                 continue
@@ -330,8 +2083,132 @@ class RecycleAdapter(EventDispatcher):
             make_view_dirty(view, index)
         # save the current visible views
         self.views = visible_views
+        self.deferred_views = deferred
         return new_views, current_views.values()
 
+    def prefetch_views(self, indices):
+        '''Asks for the views of the items at `indices` to be created and
+        synced, in that order, ahead of them becoming visible. The work is done
+        in the next frames, within :attr:`prefetch_budget` per frame, and the
+        views are kept as dirty views, i.e. synced but not added to the
+        container. Replaces the indices of the previous call.
+        '''
+        self._prefetch_indices = list(reversed(indices))
+        self._prefetch_wanted = set(indices)
+        if indices:
+            self._prefetch_trigger()
+        else:
+            self._prefetch_trigger.cancel()
+
+    def _prefetch(self, *largs):
+        indices = self._prefetch_indices
+        if self.recycleview is None:
+            return
+        if self.deferred_views:
+            # the visible views have priority
+            if indices:
+                self._prefetch_trigger()
+            return
+
+        n = len(self)
+        views = self.views
+        dirty_views = self.dirty_views
+        wanted = self._prefetch_wanted
+        deadline = default_timer() + self.prefetch_budget
+        while indices:
+            if default_timer() > deadline:
+                self._prefetch_trigger()
+                return
+            index = indices.pop()
+            if not 0 <= index < n or index in views:
+                continue
+            viewclass = self.get_viewclass(index)
+            if viewclass is None or index in dirty_views.get(viewclass, ()):
+                continue
+
+            dirty_class = dirty_views[viewclass]
+            # reuse a dirty view that is not wanted, or the cache, before
+            # creating a view
+            unwanted = next((i for i in dirty_class if i not in wanted), None)
+            stats = self._stats
+            if unwanted is not None:
+                view = dirty_class.pop(unwanted)
+                if stats is not None:
+                    stats.count('views_dirty_rebound')
+                self.refresh_view_attrs(index, view)
+            else:
+                view = self.view_pool.get(viewclass)
+                if view is not None:
+                    if stats is not None:
+                        stats.count('views_pool')
+                    self.refresh_view_attrs(index, view)
+                else:
+                    view = self.create_view(index, viewclass)
+            dirty_class[index] = view
+
+    def prewarm_views(self, viewclass, count):
+        '''Creates views of `viewclass`, a class or its name, in the next
+        frames, within :attr:`prefetch_budget` per frame, and adds them to the
+        cache until it holds `count` views of that class. The first views
+        displayed then don't have to pay for their creation and kv rules.
+
+        The time spent is accumulated in :attr:`prewarm_time`, and
+        `on_prewarm_done` is dispatched with it once all the requested views
+        are created.
+        '''
+        if isinstance(viewclass, string_types):
+            viewclass = getattr(Factory, viewclass)
+        queue = self._prewarm_queue
+        pool = self.view_pool
+        count = min(count, pool.get_limit(viewclass)) - pool.count(
+            viewclass) - sum(n for cls, n in queue if cls is viewclass)
+        if count <= 0:
+            return
+        if not queue:
+            self.prewarm_time = 0
+        queue.append([viewclass, count])
+        self._prewarm_trigger()
+
+    def _prewarm(self, *largs):
+        queue = self._prewarm_queue
+        if self.deferred_views:
+            # the visible views have priority
+            self._prewarm_trigger()
+            return
+
+        start = default_timer()
+        deadline = start + self.prefetch_budget
+        while queue and default_timer() <= deadline:
+            entry = queue[0]
+            viewclass, count = entry
+            if count <= 0:
+                queue.pop(0)
+                continue
+            view = viewclass()
+            if viewclass not in _view_base_cache:
+                _view_base_cache[viewclass] = isinstance(
+                    view, RecycleViewMixin)
+            self._cache_view(view)
+            entry[1] -= 1
+        self.prewarm_time += default_timer() - start
+
+        if any(count > 0 for _, count in queue):
+            self._prewarm_trigger()
+        else:
+            del queue[:]
+            self.dispatch('on_prewarm_done', self.prewarm_time)
+
+    def on_prewarm(self, instance, value):
+        for viewclass, count in value.items():
+            self.prewarm_views(viewclass, count)
+
+    def on_prewarm_done(self, duration):
+        '''Dispatched when the views requested with :meth:`prewarm_views` are
+        all created. `duration` is the time, in seconds, it took to create
+        them, also in :attr:`prewarm_time`.
+        '''
+        pass
+
     def get_visible_view(self, index):
         return self.views.get(index)
 
@@ -346,18 +2223,55 @@ class RecycleAdapter(EventDispatcher):
         # have to make everything dirty because the current items are good, we
         # just need to re-layout so pass on that info
         if not _kivy_1_9_1:
-            self.dispatch('on_data_changed', extent='data')
+            if self.data_source is None:
+                self.dispatch('on_data_changed', extent='data')
             return
 
+        last_len = self._last_len
+        n = self._last_len = len(value)
         last_op = value.last_op
-        if last_op in ('__iadd__', '__imul__', 'append', 'extend'):
-            extent = 'data_add'
+        if value is self._last_data and last_op is self._last_op and \
+                n == last_len:
+            # the list was not changed, only one of its dicts, e.g. one from
+            # `observable_dict`, so we don't know which item changed
+            changes = None
         else:
-            extent = 'data'
-        self.dispatch('on_data_changed', extent=extent)
+            changes = _get_data_changes(last_op, last_len, n)
+        self._last_data = value
+        self._last_op = last_op
+        if self.data_source is not None:
+            # the data is ignored while there's a source
+            return
 
-    def on_data_changed(self, extent):
-        '''Dispatched when the :attr:`data` changes.
+        if changes is None:
+            # with stable keys, views whose item only moved are kept, so only
+            # the sizes/positions need to be recomputed
+            if self.key_id and self.reuse_views_by_key(value):
+                self.dispatch('on_data_changed', extent='data_size')
+            else:
+                self.dispatch('on_data_changed', extent='data')
+            return
+        for extent, start, stop in changes:
+            self.dispatch(
+                'on_data_changed', extent=extent, start=start, stop=stop)
+
+    def on_data_source(self, instance, value):
+        source = self._bound_source
+        if source is not None:
+            funbind = source.funbind if _kivy_1_9_1 else source.fast_unbind
+            funbind('on_data_changed', self._dispatch_source_changes)
+            self._bound_source = None
+        if isinstance(value, EventDispatcher):
+            fbind = value.fbind if _kivy_1_9_1 else value.fast_bind
+            fbind('on_data_changed', self._dispatch_source_changes)
+            self._bound_source = value
+        self.dispatch('on_data_changed', extent='data')
+
+    def _dispatch_source_changes(self, source, *largs, **kwargs):
+        self.dispatch('on_data_changed', *largs, **kwargs)
+
+    def on_data_changed(self, extent, start=None, stop=None):
+        '''Dispatched when the :attr:`data`, or :attr:`data_source`, changes.
 
         :Parameters:
 
@@ -370,12 +2284,29 @@ class RecycleAdapter(EventDispatcher):
                 `data_size`: means that the data has changed, but only such
                     that we have to re-layout the data. The other non-pos/size
                     attributes of the data is still in sync with the view.
-                `data_size`: means that new elements has been added to the
+                `data_add`: means that new elements has been added to the
                     data list, but the previously existing data has not been
                     changed.
+                `data_modified`: means that the items in `[start, stop)` have
+                    been replaced, the other items did not change.
+                `data_insert`: means that the items in `[start, stop)` have
+                    been inserted, shifting the following items.
+                `data_remove`: means that the items that were in
+                    `[start, stop)` have been removed, shifting the following
+                    items.
+            `start`, `stop`: int
+                The range of the changed items, for the extents listed above
+                that have one. `data_add` may be dispatched without it.
         '''
         if extent == 'data':
             self.invalidate()
+        elif extent == 'data_modified':
+            self.refresh_views_range(start, stop)
+        elif extent == 'data_insert':
+            self._shift_views(start, stop - start)
+        elif extent == 'data_remove':
+            self._release_views(start, stop)
+            self._shift_views(stop, start - stop)
 
 
 class LayoutSelectionMixIn(CompoundSelectionBehavior):
@@ -386,30 +2317,125 @@ class LayoutSelectionMixIn(CompoundSelectionBehavior):
     using `select_node`.
     '''
 
-    _selectable_nodes = []
-    _nodes_map = {}
+    def _get_selected_nodes(self):
+        return self._selection
+
+    selected_nodes = AliasProperty(_get_selected_nodes, None)
+    '''The indices of the selected data items, in order.
+
+    Unlike the list of
+    :class:`~kivy.uix.behaviors.CompoundSelectionBehavior`, it's a read-only
+    sequence kept as ranges of indices, so that any number of items is
+    selected at once with :meth:`select_range` or :meth:`select_all`, and
+    checking whether an item is selected doesn't depend on how many are.
+    The indices are shifted when data items are inserted or removed.
+    '''
 
     def __init__(self, **kwargs):
         self.nodes_order_reversed = False
+        self._selection = _IndexRanges()
+        # the selectable items, of the first _selectable_count items
+        self._selectable = _IndexRanges()
+        self._selectable_count = 0
         super(LayoutSelectionMixIn, self).__init__(**kwargs)
 
     def compute_positions_and_sizes(self, append):
         # overwrite this method so that when data changes we update
         # selectable nodes.
         key = self.key_selection
-        nodes = self._selectable_nodes = [
-            i for i, d in enumerate(self.recycleview.data) if d.get(key)]
-        self._nodes_map = {v: k for k, v in enumerate((nodes))}
+        adapter = self.recycleview.adapter
+        n = len(adapter)
+        selectable = self._selectable
+        start = self._selectable_count if append and key else 0
+        if not start or start > n:
+            start = 0
+            selectable.clear()
+        if key:
+            selectable.add_indices(_read_flagged(adapter, key, start, n))
+        self._selectable_count = n
         return super(
             LayoutSelectionMixIn, self).compute_positions_and_sizes(append)
 
+    def update_positions_and_sizes(self, changes):
+        selection = self._selection
+        selectable = self._selectable
+        count = self._selectable_count
+
+        def shift_node(node, extent, start, stop):
+            if node is None or node < start:
+                return node
+            if extent != 'data_remove':
+                return node + stop - start
+            # a removed node becomes the item after it
+            return node - (stop - start) if node >= stop else start
+
+        def shift(extent, start, stop):
+            if extent == 'data_remove':
+                selection.delete(start, stop)
+                selectable.delete(start, stop)
+            else:
+                selection.insert(start, stop - start)
+                selectable.insert(start, stop - start)
+            self._anchor = shift_node(self._anchor, extent, start, stop)
+            self._last_selected_node = shift_node(
+                self._last_selected_node, extent, start, stop)
+
+        pending = _changed_ranges(changes, shift)
+        shifted = False
+        for extent, start, stop in changes:
+            if extent in ('data_add', 'data_insert'):
+                count += stop - start
+                shifted = True
+            elif extent == 'data_remove':
+                count -= stop - start
+                shifted = True
+
+        key = self.key_selection
+        adapter = self.recycleview.adapter
+        n = len(adapter)
+        if count != n:
+            # some change was not reported with its range
+            selectable.clear()
+            pending = [(0, n)]
+        if key:
+            for start, stop in pending:
+                stop = min(stop, n)
+                selectable.remove(start, stop)
+                selectable.add_indices(
+                    _read_flagged(adapter, key, start, stop))
+        self._selectable_count = n
+        # the positions of the nodes in the selectable nodes
+        self._anchor_idx = self._get_selectable_index(self._anchor)
+        self._last_node_idx = self._get_selectable_index(
+            self._last_selected_node)
+        if shifted and len(selection):
+            self.property('selected_nodes').dispatch(self)
+        return super(
+            LayoutSelectionMixIn, self).update_positions_and_sizes(changes)
+
     def get_selectable_nodes(self):
         # the indices of the data is used as the nodes
-        return self._selectable_nodes
-
-    def get_index_of_node(self, node, selectable_nodes):
-        # the indices of the data is used as the nodes, so node
-        return self._nodes_map[node]
+        return self._selectable
+
+    def _get_selectable_index(self, node):
+        if node is None or node not in self._selectable:
+            return 0
+        return self._selectable.index(node)
+
+    def select_with_key_down(self, keyboard, scancode, codepoint, modifiers,
+                             **kwargs):
+        text = scancode[1]
+        keys = self._key_list
+        if self.keyboard_select and self.multiselect and \
+                'ctrl' in modifiers and text in ('a', 'A') and \
+                text not in keys:
+            # all the items at once rather than one by one
+            self.select_all()
+            keys.append(text)
+            self._word_filter = ''
+            return False
+        return super(LayoutSelectionMixIn, self).select_with_key_down(
+            keyboard, scancode, codepoint, modifiers, **kwargs)
 
     def goto_node(self, key, last_node, last_node_idx):
         node, idx = super(LayoutSelectionMixIn, self).goto_node(
@@ -418,17 +2444,104 @@ class LayoutSelectionMixIn(CompoundSelectionBehavior):
             self.show_index_view(node)
         return node, idx
 
+    def _refresh_selection(self, start, stop):
+        '''Applies the selection to the visible views of the items in
+        `[start, stop)` and dispatches :attr:`selected_nodes`.
+        '''
+        selection = self._selection
+        for index, view in list(self.recycleview.adapter.views.items()):
+            if start <= index < stop:
+                self.apply_selection(index, view, index in selection)
+        self.property('selected_nodes').dispatch(self)
+
     def select_node(self, node):
-        if super(LayoutSelectionMixIn, self).select_node(node):
-            view = self.recycleview.adapter.get_visible_view(node)
-            if view is not None:
-                self.apply_selection(node, view, True)
+        selection = self._selection
+        if node in selection:
+            return False
+        if not self.multiselect and len(selection):
+            self.clear_selection()
+        selection.add(node, node + 1)
+        self._anchor = node
+        self._last_selected_node = node
+        self._refresh_selection(node, node + 1)
+        return True
 
     def deselect_node(self, node):
-        if super(LayoutSelectionMixIn, self).deselect_node(node):
-            view = self.recycleview.adapter.get_visible_view(node)
-            if view is not None:
-                self.apply_selection(node, view, False)
+        if node not in self._selection:
+            return False
+        self._selection.remove(node, node + 1)
+        self._refresh_selection(node, node + 1)
+        return True
+
+    def select_range(self, start, stop):
+        '''Selects the selectable items (see :attr:`key_selection`) in
+        `[start, stop)`, without visiting each of them. When
+        :attr:`~kivy.uix.behaviors.CompoundSelectionBehavior.multiselect` is
+        False, only the last one is selected.
+        '''
+        ranges = self._selectable.ranges(start, stop)
+        if not ranges:
+            return
+        if not self.multiselect:
+            self.select_node(ranges[-1][1] - 1)
+            return
+        selection = self._selection
+        for r_start, r_stop in ranges:
+            selection.add(r_start, r_stop)
+        self._anchor = ranges[0][0]
+        self._last_selected_node = ranges[-1][1] - 1
+        self._refresh_selection(ranges[0][0], ranges[-1][1])
+
+    def deselect_range(self, start, stop):
+        '''Deselects all the items in `[start, stop)`.
+        '''
+        self._selection.remove(start, stop)
+        self._refresh_selection(start, stop)
+
+    def select_all(self):
+        '''Selects all the selectable items, see :meth:`select_range`.
+        '''
+        self.select_range(0, len(self.recycleview.adapter))
+
+    def clear_selection(self):
+        self._selection.clear()
+        self._refresh_selection(0, len(self.recycleview.adapter))
+
+    def _select_range(self, multiselect, keep_anchor, node, idx):
+        # like CompoundSelectionBehavior, but adds the nodes between the
+        # anchor and node as ranges instead of one by one
+        sister_nodes = self._selectable
+        end = len(sister_nodes) - 1
+        if end < 0:
+            return
+        last_node = self._anchor
+        try:
+            last_idx = end if last_node is None else \
+                sister_nodes.index(last_node)
+            idx = sister_nodes.index(node)
+        except ValueError:
+            # list changed - cannot do select across them
+            return
+        if last_node is None:
+            last_node = sister_nodes[end]
+
+        first, last = sorted((last_node, node))
+        if not multiselect:
+            self._selection.clear()
+        for r_start, r_stop in sister_nodes.ranges(first, last + 1):
+            self._selection.add(r_start, r_stop)
+        self._refresh_selection(
+            0 if not multiselect else first,
+            len(self.recycleview.adapter) if not multiselect else last + 1)
+
+        if keep_anchor:
+            self._anchor = last_node
+            self._anchor_idx = last_idx
+        else:
+            self._anchor = node
+            self._anchor_idx = idx
+        self._last_selected_node = node
+        self._last_node_idx = idx
 
     def apply_selection(self, index, view, is_selected):
         viewclass = view.__class__
@@ -441,7 +2554,7 @@ class LayoutSelectionMixIn(CompoundSelectionBehavior):
     def refresh_view_layout(self, index, view, viewport):
         super(LayoutSelectionMixIn, self).refresh_view_layout(index, view,
                                                               viewport)
-        self.apply_selection(index, view, index in self.selected_nodes)
+        self.apply_selection(index, view, index in self._selection)
 
 
 class RecycleLayoutManager(EventDispatcher):
@@ -453,8 +2566,30 @@ class RecycleLayoutManager(EventDispatcher):
 
     default_size = NumericProperty("48dp")
     key_size = StringProperty()
+
+    overscan = NumericProperty(0)
+    '''The distance, in pixels, beyond the viewport for which views are
+    prepared ahead of time, in the scroll direction, so they don't have to be
+    created when they become visible. When not scrolling, it's prepared on
+    both sides. The views are created in the following frames (see
+    :meth:`RecycleAdapter.prefetch_views`), and are not added to the
+    container until visible.
+    '''
+    overscan_items = NumericProperty(0)
+    '''Like :attr:`overscan`, but a number of items.
+    '''
+    overscan_time = NumericProperty(0)
+    '''The time, in seconds, of scrolling at the current scroll velocity that
+    is added to :attr:`overscan`, so that fast flings prepare further ahead.
+    The distance is limited to 3 times the viewport size.
+    '''
+
     recycleview = None
     container = None
+    # offset of the viewport, time of the offset and velocity, for overscan
+    _scroll_offset = None
+    _scroll_time = 0
+    _scroll_velocity = 0.
 
     def attach_recycleview(self, rv):
         self.recycleview = rv
@@ -473,6 +2608,15 @@ class RecycleLayoutManager(EventDispatcher):
         """
         pass
 
+    def update_positions_and_sizes(self, changes):
+        """(internal) Updates the size and future positions of the views
+        after only some ranges of the data changed. `changes` is a list of
+        `(extent, start, stop)`, in the order they happened, see
+        :meth:`RecycleAdapter.on_data_changed`. By default, everything is
+        recalculated.
+        """
+        self.compute_positions_and_sizes(False)
+
     def recycleview_setup(self):
         pass
 
@@ -497,9 +2641,120 @@ class RecycleLayoutManager(EventDispatcher):
         """
         pass
 
-    def clear_layout(self):
-        if self.container is not None:
-            self.container.clear_widgets()
+    def clear_layout(self):
+        container = self.container
+        if container is None:
+            return
+        rv = self.recycleview
+        if rv is not None and not rv.adapter.detach_views:
+            for widget in container.children:
+                _hide_view(widget)
+        else:
+            container.clear_widgets()
+
+    def get_overscan_ranges(self, offset, length):
+        '''(internal) Returns the ranges of positions, `(start, end)` in the
+        layout direction, of the overscan area of a viewport that starts at
+        `offset` and is `length` long. The ranges are in prefetching order.
+        It also updates the scroll velocity from the previous offset.
+        '''
+        t = default_timer()
+        last, self._scroll_offset = self._scroll_offset, offset
+        dt, self._scroll_time = t - self._scroll_time, t
+        v = self._scroll_velocity
+        if last is None or dt > .25:
+            v = 0.
+        elif dt > 0:
+            v = (v + (offset - last) / dt) / 2.
+        self._scroll_velocity = v
+
+        extent = min(self.overscan + abs(v) * self.overscan_time, 3 * length)
+        if not extent:
+            return []
+        ahead = offset + length, offset + length + extent
+        behind = offset - extent, offset
+        if v > 0:
+            return [ahead]
+        if v < 0:
+            return [behind]
+        return [ahead, behind]
+
+    def get_size_reader(self):
+        '''Returns a function that takes an item index and returns the size
+        of the item, from the `get_item_size` method of the
+        :attr:`RecycleAdapter.data_source` if it has one, or else from the
+        :attr:`key_size` of the item, or its column, see
+        :meth:`get_size_column`. Returns None when neither is available,
+        meaning that all the items have the :attr:`default_size`.
+        '''
+        adapter = self.recycleview.adapter
+        default_size = self.default_size
+        get_item_size = getattr(adapter.data_source, 'get_item_size', None)
+        if get_item_size is not None:
+            def size_of(index):
+                size = get_item_size(index)
+                return default_size if size is None else size
+            return size_of
+
+        key_size = self.key_size
+        if not key_size:
+            return None
+        get_column = getattr(adapter.data_source, 'get_column', None)
+        if get_column is not None:
+            column = get_column(key_size)
+            if column is None:
+                return None
+
+            def size_of(index):
+                size = column[index]
+                return default_size if size is None else size
+            return size_of
+        return lambda index: adapter[index].get(key_size, default_size)
+
+    def get_size_column(self):
+        '''Returns the :attr:`key_size` column of the
+        :attr:`RecycleAdapter.data_source` when it stores its data by column,
+        i.e. has a `get_column(key)` method like
+        :class:`RecycleColumnDataSource`, otherwise None.
+        '''
+        key_size = self.key_size
+        get_column = getattr(
+            self.recycleview.adapter.data_source, 'get_column', None)
+        if not key_size or get_column is None:
+            return None
+        return get_column(key_size)
+
+    def prefetch_overscan(self, first, last, ranges):
+        '''(internal) Asks the adapter to prefetch the views of the overscan
+        for the visible items `first` to `last`. `ranges` are the overscan
+        ranges as item index ranges, see :meth:`get_overscan_ranges`.
+        '''
+        items = int(self.overscan_items)
+        if not ranges and not items:
+            return
+        n = len(self.recycleview.adapter)
+        indices = []
+        if items:
+            velocity = self._scroll_velocity
+            if velocity >= 0:
+                ranges.append((last + 1, last + items))
+            if velocity <= 0:
+                ranges.append((first - items, first - 1))
+
+        def clamp(index):
+            return max(0, min(index, n - 1))
+
+        seen = set()
+        for start, end in ranges:
+            if start > first:
+                order = range(clamp(start), clamp(end) + 1)
+            else:
+                order = range(clamp(end), clamp(start) - 1, -1)
+            for index in order:
+                if index not in seen and not first <= index <= last:
+                    seen.add(index)
+                    indices.append(index)
+        self.recycleview.adapter.prefetch_views(indices)
 
     def show_index_view(self, index):
         '''Moves the views so that the view corresponding to `index` is
@@ -507,6 +2762,13 @@ class RecycleLayoutManager(EventDispatcher):
         '''
         pass
 
+    def set_measured_size(self, index, size):
+        '''Called with the size, in the layout direction, measured by the
+        view of the item at `index`, see
+        :meth:`RecycleViewMixin.get_measured_size`. By default it's ignored.
+        '''
+        pass
+
 
 class LinearRecycleLayoutManager(RecycleLayoutManager):
     """Implementation of a `RecycleLayoutManager` for a horizontal or vertical
@@ -515,46 +2777,441 @@ class LinearRecycleLayoutManager(RecycleLayoutManager):
     orientation = OptionProperty("vertical",
                                  options=["horizontal", "vertical"])
 
+    size_storage = OptionProperty("list", options=["list", "array", "numpy"])
+    '''How :attr:`computed_sizes` and :attr:`computed_positions` are stored.
+
+    `'list'` stores them as lists of python floats. `'array'` stores them as
+    :class:`array.array` of doubles and `'numpy'` as numpy float arrays, which
+    requires numpy. The two compact modes use 8 bytes per item and per value,
+    and compute the positions with a single cumulative sum pass, which is
+    useful for datasets with millions of items.
+
+    When no size is given per item, i.e. without :attr:`key_size` or a
+    `get_item_size` method of the data source, all the items have the
+    :attr:`default_size` and no size is stored at all.
+    '''
+
+    auto_size = BooleanProperty(False)
+    '''Whether the sizes of the items are measured by their views. The sizes
+    given by :attr:`key_size` or :attr:`default_size` are then estimates,
+    replaced by the size returned by
+    :meth:`RecycleViewMixin.get_measured_size` once an item is displayed, or
+    given to :meth:`RecycleView.report_view_size`. Only the positions after
+    the item are updated, and the item at the top (left) of the viewport
+    keeps its place so the visible content does not jump.
+
+    Measured sizes are kept until the item changes, or all the sizes are
+    computed again, e.g. when the view is resized.
+    '''
+
+    key_header = StringProperty('')
+    '''The key of the data items that are section headers, when its value
+    is true. The header of the section at the top of the viewport is shown
+    pinned at the top, over the items, until it is pushed away by the next
+    header. Only used with the vertical orientation.
+
+    The indices of the headers are kept sorted, and updated with the ranges
+    of the data changes, so the pinned header is found with a binary search
+    when scrolling.
+    '''
+
     # internal
     computed_sizes = []
-    computed_positions = []
     computed_size = 0
+    _size_tree = None
+    _headers = []  # the sorted indices of the header items
+    _header_view = None  # the pinned header view
+    _header_index = None  # the item of the pinned header view, if synced
+    _measuring = False
+
+    @property
+    def computed_positions(self):
+        '''A read-only sequence with the position of each item, the sum of
+        the sizes of the items before it.
+        '''
+        return _ItemPositions(self._size_tree)
 
     def compute_positions_and_sizes(self, append):
-        recycleview = self.recycleview
-        height = 0
+        self._compute_headers(append)
+        self._compute_sizes(append)
+
+    def _compute_sizes(self, append):
+        adapter = self.recycleview.adapter
         key_size = self.key_size
         default_size = self.default_size
-        data = recycleview.adapter.data
-        if append and len(self.computed_positions) > 0:
-            sizes = self.computed_sizes
-            pos = self.computed_positions
-            n = len(sizes)
-
-            sizes.extend(
-                [item.get(key_size, default_size) for item in data[n:]]
-            )
-            self.computed_size += sum(sizes[n:])
-            pos.extend(
-                self._compute_positions(sizes[n:], pos[-1] + sizes[n - 1]))
-        else:
-            self.computed_sizes = [
-                item.get(key_size, default_size)
-                for item in data
-            ]
-            self.computed_size = sum(self.computed_sizes)
-            self.computed_positions = list(
-                self._compute_positions(self.computed_sizes))
+        storage = self.size_storage
+        n_items = len(adapter)
+        size_of = self.get_size_reader()
+        if size_of is None:
+            # all the items have the default size, so there's nothing to
+            # compute or store per item
+            self.computed_sizes = self._size_tree = _UniformSizes(
+                n_items, default_size)
+            self.computed_size = self._size_tree.total()
+            self._update_container_size()
+            return
+
+        sizes = self.computed_sizes
+        tree = self._size_tree
+        n = len(sizes) if append and tree is not None else 0
+
+        column = self.get_size_column()
+        if column is not None:
+            if isinstance(column, array) or numpy is not None and \
+                    isinstance(column, numpy.ndarray):
+                # converted in one go, the values can't be None
+                values = column[n:]
+            else:
+                values = (default_size if size is None else size
+                          for size in islice(column, n, None))
+        elif key_size and adapter.data_source is None:
+            values = (item.get(key_size, default_size)
+                      for item in islice(adapter.data, n, None))
+        else:
+            values = (size_of(i) for i in range(n, n_items))
+        new_sizes = _new_sizes(storage, n_items - n, values)
+
+        if n and tree.storage == storage:
+            sizes = self.computed_sizes = _concat_sizes(sizes, new_sizes)
+            if storage == 'numpy':
+                # rebuilding is a vectorized O(n), cheaper than python steps
+                tree.rebuild(sizes, n)
+            else:
+                tree.extend(new_sizes)
+        else:
+            if n:
+                new_sizes = _concat_sizes(
+                    _new_sizes(storage, n, sizes), new_sizes)
+            self.computed_sizes = new_sizes
+            self._size_tree = _new_size_tree(new_sizes, storage)
+
+        self.computed_size = self._size_tree.total()
+        self._update_container_size()
+
+    def update_positions_and_sizes(self, changes):
+        # the item at the top of the viewport stays in place, e.g. when
+        # older messages are inserted at the start of a chat
+        anchor = self._get_anchor()
+        if anchor is not None:
+            index, delta = anchor
+            for extent, start, stop in changes:
+                if extent in ('data_add', 'data_insert') and start <= index:
+                    index += stop - start
+                elif extent == 'data_remove' and start <= index:
+                    if stop <= index:
+                        index -= stop - start
+                    else:
+                        index, delta = start, 0
+            anchor = index, delta
+
+        self._update_headers(changes)
+        self._update_sizes(changes)
+        self._restore_anchor(anchor)
+
+    def _update_sizes(self, changes):
+        tree = self._size_tree
+        if tree is None or tree.storage != self.size_storage:
+            self._compute_sizes(False)
+            return
+
+        sizes = self.computed_sizes
+        # ranges, in the current indices, whose size must be read from data
+        pending = []
+        resized = False
+        for extent, start, stop in changes:
+            count = stop - start
+            if extent in ('data_add', 'data_insert'):
+                sizes = _insert_sizes(sizes, start, count)
+                shifted = []
+                for r_start, r_stop in pending:
+                    if r_start >= start:
+                        shifted.append((r_start + count, r_stop + count))
+                    elif r_stop > start:
+                        shifted.append((r_start, start))
+                        shifted.append((start + count, r_stop + count))
+                    else:
+                        shifted.append((r_start, r_stop))
+                pending = shifted
+                pending.append((start, stop))
+                resized = True
+            elif extent == 'data_remove':
+                sizes = _delete_sizes(sizes, start, stop)
+                shifted = []
+                for r_start, r_stop in pending:
+                    if r_start > start:
+                        r_start = max(start, r_start - count)
+                    if r_stop > start:
+                        r_stop = max(start, r_stop - count)
+                    if r_stop > r_start:
+                        shifted.append((r_start, r_stop))
+                pending = shifted
+                resized = True
+            else:
+                pending.append((start, stop))
+
+        if len(sizes) != len(self.recycleview.adapter):
+            # some change was not reported with its range
+            self.compute_positions_and_sizes(False)
+            return
 
+        default_size = self.default_size
+        size_of = self.get_size_reader() or (lambda index: default_size)
+        self.computed_sizes = sizes
+        for start, stop in pending:
+            for index in range(start, stop):
+                size = size_of(index)
+                if resized:
+                    sizes[index] = size
+                else:
+                    delta = size - sizes[index]
+                    if delta:
+                        sizes[index] = size
+                        tree.add(index, delta)
+
+        if resized:
+            # inserting/removing sizes moves all the following positions
+            tree.rebuild(sizes, min(start for _, start, _ in changes))
+        self.computed_size = tree.total()
+        self._update_container_size()
+
+    def _update_container_size(self):
+        recycleview = self.recycleview
         if self.orientation == "horizontal":
             recycleview.container.size = self.computed_size, recycleview.height
         else:
             recycleview.container.size = recycleview.width, self.computed_size
 
-    def _compute_positions(self, sizes, pos=0):
-        for size in sizes:
-            yield pos
-            pos += size
+    def _read_headers(self, start, stop):
+        '''Returns the indices of the header items in `[start, stop)`.
+        '''
+        return _read_flagged(
+            self.recycleview.adapter, self.key_header, start, stop)
+
+    def _compute_headers(self, append):
+        self._header_index = None
+        if not self.key_header:
+            self._headers = []
+            return
+        tree = self._size_tree
+        start = len(tree) if append and tree is not None else 0
+        headers = self._headers if start else []
+        headers.extend(
+            self._read_headers(start, len(self.recycleview.adapter)))
+        self._headers = headers
+
+    def _update_headers(self, changes):
+        '''Updates the header indices after the data `changes`, see
+        :meth:`update_positions_and_sizes`.
+        '''
+        self._header_index = None
+        if not self.key_header:
+            return
+        headers = self._headers
+
+        def shift(extent, start, stop):
+            count = stop - start
+            k = bisect_left(headers, start)
+            if extent == 'data_remove':
+                headers[k:] = [
+                    i - count for i in headers[bisect_left(headers, stop):]]
+            else:
+                headers[k:] = [i + count for i in headers[k:]]
+
+        n = len(self.recycleview.adapter)
+        for start, stop in _changed_ranges(changes, shift):
+            stop = min(stop, n)
+            if start < stop:
+                headers[bisect_left(headers, start):
+                        bisect_left(headers, stop)] = \
+                    self._read_headers(start, stop)
+
+    def get_header_index(self, index):
+        '''Returns the index of the header of the section of the item at
+        `index`, i.e. the last header at or before it, or None. See
+        :attr:`key_header`.
+        '''
+        headers = self._headers
+        k = bisect_right(headers, index) - 1
+        return headers[k] if k >= 0 else None
+
+    def _pin_header(self, offset, viewport):
+        '''Shows the header of the section at `offset`, from the top, pinned
+        at the top of the viewport.
+        '''
+        headers = self._headers
+        tree = self._size_tree
+        k = bisect_right(headers, tree.index_at(offset)) - 1
+        if k < 0:
+            self._release_header_view()
+            return
+
+        rv = self.recycleview
+        container = rv.container
+        index = headers[k]
+        view = self._header_view
+        if index != self._header_index or view is None:
+            if view is not None and view.parent is not None:
+                _show_view(view)
+                view.parent.remove_widget(view)
+            view = self._header_view = rv.adapter.get_pinned_view(index, view)
+            self._header_index = index
+
+        # it's pushed up by the next header
+        size = float(self.computed_sizes[index])
+        pos = offset
+        if k + 1 < len(headers):
+            pos = min(pos, tree.position(headers[k + 1]) - size)
+
+        view.size_hint = None, None
+        if view.__class__ not in _view_base_cache:
+            _view_base_cache[view.__class__] = isinstance(view,
+                                                          RecycleViewMixin)
+        x, y = 0, self.computed_size - pos - size
+        w, h = container.width, size
+        if rv.stats is not None:
+            rv.stats.count_class('refresh_view_layout', view.__class__)
+        if _view_base_cache[view.__class__]:
+            view.refresh_view_layout(rv, index, (x, y), (w, h), viewport)
+        else:
+            view.size = w, h
+            view.pos = x, y
+
+        # the last added widget is drawn over the others
+        if view.parent is not None and container.children[0] is not view:
+            _show_view(view)
+            container.remove_widget(view)
+        if view.parent is None:
+            container.add_widget(view)
+        _show_view(view)
+        # the views hidden in the container, see RecycleAdapter.detach_views,
+        # are drawn last once shown again, the header is moved after them
+        canvas = container.canvas
+        children = canvas.children
+        if children[-2 if canvas.has_after else -1] is not view.canvas:
+            canvas.remove(view.canvas)
+            canvas.add(view.canvas)
+
+    def _release_header_view(self):
+        view = self._header_view
+        if view is None:
+            return
+        if view.parent is not None:
+            _show_view(view)
+            view.parent.remove_widget(view)
+        self.recycleview.adapter.view_pool.add(view)
+        self._header_view = self._header_index = None
+
+    def _get_scroll_offset(self):
+        '''Returns the distance from the top (left) of the container to the
+        top (left) of the viewport.
+        '''
+        rv = self.recycleview
+        if self.orientation == "vertical":
+            span = rv.container.height - rv.height
+            return span * (1 - min(1, max(rv.scroll_y, 0))) if span > 0 else 0
+        span = rv.container.width - rv.width
+        return span * min(1, max(rv.scroll_x, 0)) if span > 0 else 0
+
+    def _get_anchor(self):
+        '''Returns the item at the top (left) of the viewport and the distance
+        from its top (left) to the viewport's, so they can be kept with
+        :meth:`_restore_anchor` when sizes change.
+        '''
+        tree = self._size_tree
+        if tree is None or not len(tree):
+            return None
+        offset = self._get_scroll_offset()
+        index = min(tree.index_at(offset), len(tree) - 1)
+        return index, offset - tree.position(index)
+
+    def _restore_anchor(self, anchor):
+        tree = self._size_tree
+        if anchor is None or tree is None or not len(tree):
+            return
+        index, delta = anchor
+        offset = tree.position(min(index, len(tree) - 1)) + delta
+        rv = self.recycleview
+        if self.orientation == "vertical":
+            span = rv.container.height - rv.height
+            if span > 0:
+                rv.scroll_y = min(1, max(1 - offset / float(span), 0))
+        else:
+            span = rv.container.width - rv.width
+            if span > 0:
+                rv.scroll_x = min(1, max(offset / float(span), 0))
+
+    def set_measured_size(self, index, size):
+        if not self.auto_size or not 0 <= index < len(self.computed_sizes):
+            return
+        if size == self.computed_sizes[index]:
+            return
+        anchor = self._get_anchor()
+        self.update_item_size(index, size)
+        self._restore_anchor(anchor)
+
+    def _measure_views(self, views):
+        '''Updates the sizes of the items with the sizes measured by their
+        `views`, a list of `(view, index)`. Returns whether a size changed.
+        '''
+        rv = self.recycleview
+        changed = []
+        for view, index in views:
+            if not _view_base_cache[view.__class__]:
+                continue
+            size = view.get_measured_size(rv, index)
+            if size is not None and size != self.computed_sizes[index]:
+                changed.append((index, size))
+        if not changed:
+            return False
+
+        anchor = self._get_anchor()
+        tree = self._size_tree
+        if isinstance(tree, _UniformSizes):
+            self.update_item_size(*changed.pop())
+        sizes = self.computed_sizes
+        tree = self._size_tree
+        for index, size in changed:
+            tree.add(index, size - sizes[index])
+            sizes[index] = size
+        self.computed_size = tree.total()
+        self._update_container_size()
+        self._restore_anchor(anchor)
+        return True
+
+    def on_key_header(self, instance, value):
+        if self.recycleview is not None:
+            self.recycleview.ask_refresh_from_data(extent='data_size')
+
+    on_auto_size = on_key_header
+
+    def update_item_size(self, index, size):
+        '''Changes the size of the item at `index` to `size`. Only the size
+        tree is updated, so the positions of the following items and
+        :attr:`computed_size` are changed in O(log n) rather than recomputing
+        all the sizes. The data itself is not changed, so the value of
+        :attr:`key_size` in the data should be updated as well, if used, for
+        it to be kept on the next full layout.
+        '''
+        tree = self._size_tree
+        if isinstance(tree, _UniformSizes):
+            # from now on the sizes differ, so they are stored per item
+            storage = self.size_storage
+            self.computed_sizes = _new_sizes(
+                storage, len(tree), fill=tree.size)
+            self._size_tree = _new_size_tree(self.computed_sizes, storage)
+        sizes = self.computed_sizes
+        delta = size - sizes[index]
+        if not delta:
+            return
+        sizes[index] = size
+        self._size_tree.add(index, delta)
+        self.computed_size = self._size_tree.total()
+        self._update_container_size()
+        self.recycleview.ask_refresh_viewport()
+
+    def on_size_storage(self, instance, value):
+        if self.recycleview is not None:
+            self.recycleview.ask_refresh_from_data(extent='data_size')
 
     def recycleview_setup(self):
         """(internal) Prepare the scrollview and container to receive widgets
@@ -593,24 +3250,50 @@ class LinearRecycleLayoutManager(RecycleLayoutManager):
         # now calculate the view indices we must show
         at_idx = self.get_view_index_at
         s, e, = at_idx(px_start), at_idx(px_end)
-        data = recycleview.data
+        n = len(recycleview.adapter)
         if s is None:
-            s = len(data) - 1
+            s = n - 1
         if e is None:
-            e = len(data) - 1
+            e = n - 1
         new, old = recycleview.get_views(s, e)
 
-        rm = container.remove_widget
+        adapter = recycleview.adapter
+        hide_view = adapter.hide_view
         for widget in old:
-            rm(widget)
+            hide_view(widget)
 
         refresh_view_layout = self.refresh_view_layout
-        add = container.add_widget
+        show_view = adapter.show_view
         for widget, index in new:
             # add to the container if it's not already done
             refresh_view_layout(index, widget, viewport)
-            if widget.parent is None:
-                add(widget)
+            show_view(widget)
+
+        if self.auto_size and not self._measuring and self._measure_views(new):
+            # lay out again with the measured sizes, in the same frame
+            self._measuring = True
+            try:
+                self.compute_visible_views()
+            finally:
+                self._measuring = False
+            return
+
+        if self.orientation == "vertical":
+            offset = container.height - px_start[1]
+            length = px_start[1] - px_end[1]
+        else:
+            offset = px_start[0]
+            length = px_end[0] - px_start[0]
+        if self._headers and self.orientation == "vertical":
+            self._pin_header(offset, viewport)
+        else:
+            self._release_header_view()
+        ranges = self.get_overscan_ranges(offset, length)
+        tree = self._size_tree
+        n = len(tree) - 1
+        ranges = [(min(tree.index_at(start), n), min(tree.index_at(end), n))
+                  for start, end in ranges]
+        self.prefetch_overscan(s, e, ranges)
 
     def refresh_view_layout(self, index, view, viewport):
         """(internal) Refresh the layout of a view. Size and pos are determine
@@ -625,13 +3308,13 @@ class LinearRecycleLayoutManager(RecycleLayoutManager):
 
         if self.orientation == "vertical":
             w = container.width
-            h = self.computed_sizes[index]
-            y = self.computed_size - self.computed_positions[index] - h
+            h = float(self.computed_sizes[index])
+            y = self.computed_size - self._size_tree.position(index) - h
             x = 0
         else:
             h = container.height
-            w = self.computed_sizes[index]
-            x = self.computed_size - self.computed_positions[index] - w
+            w = float(self.computed_sizes[index])
+            x = self.computed_size - self._size_tree.position(index) - w
             y = 0
 
         if _view_base_cache[view.__class__]:
@@ -641,61 +3324,471 @@ class LinearRecycleLayoutManager(RecycleLayoutManager):
             view.pos = x, y
 
     def get_view_position(self, index):
-        return self.computed_positions[index]
+        return self._size_tree.position(index)
 
     def get_view_size(self, index):
-        return self.computed_sizes[index]
+        return float(self.computed_sizes[index])
 
     def get_view_index_at(self, pos):
         if self.orientation == 'vertical':
             pos = self.recycleview.container.height - pos[1]
         else:
             pos = pos[0]
-        for index, c_pos in enumerate(self.computed_positions):
-            if c_pos > pos:
-                return max(index - 1, 0)
-        if pos >= self.computed_positions[-1] + self.computed_sizes[-1]:
+        # the size tree finds the view containing `pos` in O(log n)
+        tree = self._size_tree
+        index = tree.index_at(pos)
+        if index < len(tree):
+            return index
+        return None
+
+    def show_index_view(self, index):
+        _show_span(self.recycleview, self.orientation,
+                   self.get_view_position(index), self.get_view_size(index))
+
+
+class GridRecycleLayoutManager(RecycleLayoutManager):
+    """Implementation of a `RecycleLayoutManager` that arranges the views in a
+    grid. With the vertical orientation, the items fill rows of :attr:`cols`
+    cells from the left, and the rows are stacked from the top. With the
+    horizontal orientation, they fill columns of :attr:`rows` cells from the
+    top, and the columns are stacked from the left.
+
+    The cells of a row (column) share the width (height) of the view
+    equally. The height (width) of a row (column) is :attr:`default_size`, or
+    the largest size of its items when the items have a size, see
+    :attr:`key_size`. When all the rows have the default size, the positions
+    are computed arithmetically, otherwise from the sums of the row sizes.
+    """
+
+    orientation = OptionProperty("vertical",
+                                 options=["horizontal", "vertical"])
+
+    cols = NumericProperty(None, allownone=True)
+    '''The number of cells in a row, with the vertical orientation. If None,
+    it is the number of cells at least :attr:`min_cell_size` wide that fit in
+    the width of the view.
+    '''
+
+    rows = NumericProperty(None, allownone=True)
+    '''The number of cells in a column, with the horizontal orientation. If
+    None, it is the number of cells at least :attr:`min_cell_size` high that
+    fit in the height of the view.
+    '''
+
+    min_cell_size = NumericProperty("100dp")
+    '''The smallest width (height) of the cells when :attr:`cols`
+    (:attr:`rows`) is None.
+    '''
+
+    # internal
+    line_cells = 1  # the number of cells in a row (column)
+    cell_size = 0  # the width (height) of the cells
+    computed_size = 0
+    _line_sizes = []
+    _line_tree = None
+
+    def compute_positions_and_sizes(self, append):
+        n = len(self.recycleview.adapter)
+        count = self._update_line_cells()
+        n_lines = (n + count - 1) // count
+
+        size_of = self.get_size_reader()
+        if size_of is None:
+            self._line_sizes = self._line_tree = _UniformSizes(
+                n_lines, self.default_size)
+        else:
+            column = self.get_size_column()
+            if numpy is not None and isinstance(column, numpy.ndarray):
+                cells = numpy.zeros(n_lines * count, dtype=numpy.float64)
+                cells[:n] = column
+                sizes = cells.reshape(n_lines, count).max(axis=1).tolist()
+            else:
+                sizes = [self._get_line_size(size_of, line, n)
+                         for line in range(n_lines)]
+            self._line_sizes = sizes
+            self._line_tree = _SizeTree(sizes, 'list')
+
+        self.computed_size = self._line_tree.total()
+        self._update_container_size()
+
+    def _update_line_cells(self):
+        '''Computes :attr:`line_cells` and :attr:`cell_size` and returns the
+        former.
+        '''
+        recycleview = self.recycleview
+        if self.orientation == "vertical":
+            count, across = self.cols, recycleview.width
+        else:
+            count, across = self.rows, recycleview.height
+        if not count:
+            min_size = self.min_cell_size
+            count = across // min_size if min_size > 0 else 1
+        count = self.line_cells = max(1, int(count))
+        self.cell_size = across / float(count)
+        return count
+
+    def _get_line_size(self, size_of, line, n):
+        count = self.line_cells
+        return max(size_of(index) for index in
+                   range(line * count, min(n, line * count + count)))
+
+    def update_positions_and_sizes(self, changes):
+        tree = self._line_tree
+        size_of = self.get_size_reader()
+        if size_of is None or not isinstance(tree, _SizeTree) or any(
+                extent != 'data_modified' for extent, _, _ in changes):
+            # inserting or removing items moves the following items to
+            # other rows, so all the rows change
+            self.compute_positions_and_sizes(False)
+            return
+
+        n = len(self.recycleview.adapter)
+        count = self.line_cells
+        sizes = self._line_sizes
+        lines = set()
+        for _, start, stop in changes:
+            lines.update(range(start // count, (stop - 1) // count + 1))
+        for line in sorted(lines):
+            size = self._get_line_size(size_of, line, n)
+            delta = size - sizes[line]
+            if delta:
+                sizes[line] = size
+                tree.add(line, delta)
+        self.computed_size = tree.total()
+        self._update_container_size()
+
+    def _update_container_size(self):
+        recycleview = self.recycleview
+        if self.orientation == "horizontal":
+            recycleview.container.size = self.computed_size, recycleview.height
+        else:
+            recycleview.container.size = recycleview.width, self.computed_size
+
+    def on_orientation(self, instance, value):
+        if self.recycleview is not None:
+            self.recycleview.ask_refresh_all()
+
+    def on_cols(self, instance, value):
+        if self.recycleview is not None:
+            self.recycleview.ask_refresh_from_data(extent='data_size')
+
+    on_rows = on_min_cell_size = on_cols
+
+    def recycleview_setup(self):
+        recycleview = self.recycleview
+        if self.orientation == "horizontal":
+            recycleview.do_scroll_x = True
+            recycleview.do_scroll_y = False
+        else:
+            recycleview.do_scroll_x = False
+            recycleview.do_scroll_y = True
+
+    def _get_viewport(self):
+        '''Returns the viewport, and its offset from the top (left) and its
+        length in the scrolling direction.
+        '''
+        recycleview = self.recycleview
+        container = recycleview.container
+        if self.orientation == "vertical":
+            h = container.height
+            scroll_y = min(1, max(recycleview.scroll_y, 0))
+            bottom = max(0, (h - recycleview.height) * scroll_y)
+            top = bottom + min(recycleview.height, h)
+            return (0, bottom, container.width, top), h - top, top - bottom
+        w = container.width
+        scroll_x = min(1, max(recycleview.scroll_x, 0))
+        left = max(0, (w - recycleview.width) * scroll_x)
+        right = left + min(recycleview.width, w)
+        return (right, 0, left, container.height), left, right - left
+
+    def _add_views(self, new, old, viewport):
+        adapter = self.recycleview.adapter
+        hide_view = adapter.hide_view
+        for widget in old:
+            hide_view(widget)
+
+        refresh_view_layout = self.refresh_view_layout
+        show_view = adapter.show_view
+        for widget, index in new:
+            refresh_view_layout(index, widget, viewport)
+            show_view(widget)
+
+    def compute_visible_views(self):
+        recycleview = self.recycleview
+        viewport, offset, length = self._get_viewport()
+
+        # the visible rows (columns) give a continuous range of items
+        tree = self._line_tree
+        last_line = len(tree) - 1
+        count = self.line_cells
+        n = len(recycleview.adapter)
+        first = min(tree.index_at(offset), last_line)
+        last = min(tree.index_at(offset + length), last_line)
+        s = first * count
+        e = min(n, (last + 1) * count) - 1
+        new, old = recycleview.get_views(s, e)
+        self._add_views(new, old, viewport)
+
+        ranges = [
+            (min(tree.index_at(start), last_line) * count,
+             min(tree.index_at(end), last_line) * count + count - 1)
+            for start, end in self.get_overscan_ranges(offset, length)]
+        self.prefetch_overscan(s, e, ranges)
+
+    def refresh_view_layout(self, index, view, viewport):
+        rv = self.recycleview
+        view.size_hint = None, None
+        if view.__class__ not in _view_base_cache:
+            _view_base_cache[view.__class__] = isinstance(view,
+                                                          RecycleViewMixin)
+
+        line, cell = divmod(index, self.line_cells)
+        pos = self._line_tree.position(line)
+        size = float(self._line_sizes[line])
+        cell_size = self.cell_size
+        if self.orientation == "vertical":
+            w, h = cell_size, size
+            x = cell * cell_size
+            y = self.computed_size - pos - h
+        else:
+            w, h = size, cell_size
+            x = pos
+            y = rv.container.height - (cell + 1) * cell_size
+
+        if _view_base_cache[view.__class__]:
+            view.refresh_view_layout(rv, index, (x, y), (w, h), viewport)
+        else:
+            view.size = w, h
+            view.pos = x, y
+
+    def get_view_position(self, index):
+        '''Returns the position of the row (column) of the item at `index`,
+        from the top (left).
+        '''
+        return self._line_tree.position(index // self.line_cells)
+
+    def get_view_size(self, index):
+        '''Returns the height (width) of the row (column) of the item at
+        `index`.
+        '''
+        return float(self._line_sizes[index // self.line_cells])
+
+    def get_view_index_at(self, pos):
+        container = self.recycleview.container
+        if self.orientation == 'vertical':
+            along, across = container.height - pos[1], pos[0]
+        else:
+            along, across = pos[0], container.height - pos[1]
+        tree = self._line_tree
+        line = tree.index_at(along)
+        if line >= len(tree):
             return None
-        return index
+        count = self.line_cells
+        cell = int(across // self.cell_size) if self.cell_size > 0 else 0
+        index = line * count + min(max(cell, 0), count - 1)
+        if index < len(self.recycleview.adapter):
+            return index
+        return None
 
     def show_index_view(self, index):
+        _show_span(self.recycleview, self.orientation,
+                   self.get_view_position(index), self.get_view_size(index))
+
+
+class StaggeredRecycleLayoutManager(GridRecycleLayoutManager):
+    """Implementation of a `RecycleLayoutManager` that arranges the views in
+    staggered columns (rows), like a masonry wall. Each item is put at the
+    end of the column (row) that is the shortest when it is placed, so items
+    of different sizes leave no gaps. The number of columns (rows) is set like
+    with :class:`GridRecycleLayoutManager` and the size of each item, in the
+    scrolling direction, is its own size.
+
+    The positions of the items of each column are kept in order, so the
+    visible items are found with a binary search per column. Items appended
+    to the data are placed after the existing ones, which don't move, and
+    changing some items only places again the items from the first changed
+    one.
+    """
+
+    # internal
+    _positions = []  # the position of each item
+    _sizes = []  # the size of each item
+    _item_lines = []  # the column (row) of each item
+    _line_items = []  # the items of each column (row), in order
+    _line_starts = []  # the positions of the items of each column (row)
+    _line_ends = []  # the size of each column (row)
+
+    def compute_positions_and_sizes(self, append):
+        cell_size = self.cell_size
+        if self._update_line_cells() != len(self._line_ends) or \
+                cell_size != self.cell_size:
+            append = False
+        if append:
+            self._place(len(self._positions))
+            return
+
+        count = self.line_cells
+        self._positions = []
+        self._sizes = []
+        self._item_lines = []
+        self._line_items = [[] for _ in range(count)]
+        self._line_starts = [[] for _ in range(count)]
+        self._line_ends = [0.] * count
+        self._place(0)
+
+    def update_positions_and_sizes(self, changes):
+        if self._update_line_cells() != len(self._line_ends):
+            self.compute_positions_and_sizes(False)
+            return
+
+        # the following items may move to other columns (rows), so they
+        # are all placed again
+        start = min(start for _, start, _ in changes)
+        sizes = self._sizes
+        line_ends = self._line_ends
+        for line, items in enumerate(self._line_items):
+            k = bisect_left(items, start)
+            line_ends[line] = self._line_starts[line][k - 1] + \
+                sizes[items[k - 1]] if k else 0.
+            del items[k:]
+            del self._line_starts[line][k:]
+        del self._positions[start:]
+        del sizes[start:]
+        del self._item_lines[start:]
+        self._place(start)
+
+    def _place(self, start):
+        '''Places the items from `start` to the end of the data, after the
+        items placed already.
+        '''
+        n = len(self.recycleview.adapter)
+        size_of = self.get_size_reader()
+        default_size = self.default_size
+        positions = self._positions
+        sizes = self._sizes
+        item_lines = self._item_lines
+        line_items = self._line_items
+        line_starts = self._line_starts
+        line_ends = self._line_ends
+        lines = range(len(line_ends))
+        for index in range(start, n):
+            size = size_of(index) if size_of is not None else default_size
+            line = min(lines, key=line_ends.__getitem__)
+            pos = line_ends[line]
+            line_ends[line] = pos + size
+            positions.append(pos)
+            sizes.append(size)
+            item_lines.append(line)
+            line_items[line].append(index)
+            line_starts[line].append(pos)
+
+        self.computed_size = max(line_ends) if line_ends else 0
+        self._update_container_size()
+
+    def get_indices_in(self, start, end):
+        '''Returns the sorted list of the items that are, at least partly,
+        between the positions `start` and `end`.
+        '''
+        sizes = self._sizes
+        indices = []
+        for items, starts in zip(self._line_items, self._line_starts):
+            first = max(0, bisect_right(starts, start) - 1)
+            last = bisect_left(starts, end)
+            if first < last and starts[first] + sizes[items[first]] <= start:
+                first += 1
+            indices.extend(items[first:last])
+        indices.sort()
+        return indices
+
+    def compute_visible_views(self):
+        recycleview = self.recycleview
+        viewport, offset, length = self._get_viewport()
+        indices = self.get_indices_in(offset, offset + length)
+        if not indices:
+            new, old = recycleview.get_views(0, -1)
+            self._add_views(new, old, viewport)
+            return
+
+        s, e = indices[0], indices[-1]
+        new, old = recycleview.get_views(s, e, indices)
+        self._add_views(new, old, viewport)
+
+        # the overscan items are not a continuous range either, so they are
+        # prefetched directly, the closest first
+        ranges = self.get_overscan_ranges(offset, length)
+        items = int(self.overscan_items)
+        if not ranges and not items:
+            return
+        seen = set(indices)
+        prefetch = []
+        for start, end in ranges:
+            overscan = self.get_indices_in(start, end)
+            if start < offset:
+                overscan.reverse()
+            prefetch.extend(i for i in overscan if i not in seen)
+            seen.update(overscan)
+        if items:
+            n = len(recycleview.adapter)
+            velocity = self._scroll_velocity
+            if velocity >= 0:
+                prefetch.extend(i for i in range(e + 1, min(n, e + 1 + items))
+                                if i not in seen)
+            if velocity <= 0:
+                prefetch.extend(i for i in range(s - 1, max(-1, s - 1 - items),
+                                                 -1) if i not in seen)
+        recycleview.adapter.prefetch_views(prefetch)
+
+    def refresh_view_layout(self, index, view, viewport):
         rv = self.recycleview
+        view.size_hint = None, None
+        if view.__class__ not in _view_base_cache:
+            _view_base_cache[view.__class__] = isinstance(view,
+                                                          RecycleViewMixin)
+
+        line = self._item_lines[index]
+        pos = self._positions[index]
+        size = float(self._sizes[index])
+        cell_size = self.cell_size
         if self.orientation == "vertical":
-            h = rv.container.height
-            if h <= rv.height:  # all views are visible
-                return
+            w, h = cell_size, size
+            x = line * cell_size
+            y = self.computed_size - pos - h
+        else:
+            w, h = size, cell_size
+            x = pos
+            y = rv.container.height - (line + 1) * cell_size
 
-            # convert everything to container coordinates
-            top = h - self.computed_positions[index]
-            bottom = top - self.computed_sizes[index]
-            view_h = h - rv.height
-            view_bot = view_h * min(1, max(rv.scroll_y, 0))
-            view_top = view_bot + rv.height
-
-            if top <= view_top:
-                if bottom >= view_bot:  # it's fully in view
-                    return
-                rv.scroll_y = bottom / float(view_h)
-            else:
-                rv.scroll_y = (top - rv.height) / float(view_h)
+        if _view_base_cache[view.__class__]:
+            view.refresh_view_layout(rv, index, (x, y), (w, h), viewport)
         else:
-            w = rv.container.width
-            if w <= rv.width:  # all views are visible
-                return
+            view.size = w, h
+            view.pos = x, y
 
-            # convert everything to container coordinates
-            left = self.computed_positions[index]
-            right = left + self.computed_sizes[index]
-            view_w = w - rv.width
-            view_left = view_w * min(1, max(rv.scroll_x, 0))
-            view_right = view_left + rv.width
-
-            if left >= view_left:
-                if right <= view_right:  # it's fully in view
-                    return
-                rv.scroll_x = (right - rv.width) / float(view_w)
-            else:
-                rv.scroll_x = left / float(view_w)
+    def get_view_position(self, index):
+        return self._positions[index]
+
+    def get_view_size(self, index):
+        return float(self._sizes[index])
+
+    def get_view_index_at(self, pos):
+        container = self.recycleview.container
+        if self.orientation == 'vertical':
+            along, across = container.height - pos[1], pos[0]
+        else:
+            along, across = pos[0], container.height - pos[1]
+        count = len(self._line_items)
+        if not count:
+            return None
+        line = int(across // self.cell_size) if self.cell_size > 0 else 0
+        line = min(max(line, 0), count - 1)
+        starts = self._line_starts[line]
+        k = bisect_right(starts, along) - 1
+        if k < 0:
+            return None
+        index = self._line_items[line][k]
+        if along >= starts[k] + self._sizes[index]:
+            return None
+        return index
 
 
 class RecycleView(ScrollView):
@@ -710,9 +3803,12 @@ class RecycleView(ScrollView):
     _layout_manager = None
     _container = None
     _refresh_trigger = None
+    _refreshing = False
+    # the (object, method name) wrapped for the tracer
+    _traced = []
     _refresh_flags = {
         'all': True, 'data': True, 'data_size': True,
-        'data_add': True, 'viewport': True
+        'data_range': False, 'data_add': True, 'viewport': True
     }
     '''These flags indicate how much the view is out of sync and needs to
     be synchronized with the data. The goal is that the minimum amount
@@ -733,6 +3829,9 @@ class RecycleView(ScrollView):
         size/pos for existing data insatances because they did not change.
         Added data will get new class instances and will have their values
         applied.
+    -data_range: Similar to `data_size`, except that only known ranges of
+        the data were modified, inserted or removed. The changes, in order, are
+        stored in `_data_changes`, and only their sizes need to be read again.
     -data_add: Similar to `data_size`, except that data, if added, was added
         at the end. This will allow further possible optimizations, but may
         be implemented as `data_size`.
@@ -742,7 +3841,10 @@ class RecycleView(ScrollView):
 
     def __init__(self, **kwargs):
         self._refresh_flags = dict(self._refresh_flags)
+        self._data_changes = []
         self._refresh_trigger = Clock.create_trigger(self.refresh_views, -1)
+        self._deferred_trigger = Clock.create_trigger(
+            self.ask_refresh_viewport)
 
         if self._layout_manager is None:
             self.layout_manager = LinearRecycleLayoutManager()
@@ -759,16 +3861,36 @@ class RecycleView(ScrollView):
         self._refresh_trigger()
 
     def refresh_views(self, *largs, **kwargs):
+        stats = self.stats
+        tracer = self.tracer
+        if (stats is not None or tracer is not None) and \
+                not self._refreshing:
+            # the refresh after a LayoutChangeException is part of this one
+            self._refreshing = True
+            t = default_timer()
+            try:
+                self.refresh_views(*largs, **kwargs)
+            finally:
+                self._refreshing = False
+                duration = default_timer() - t
+                if stats is not None:
+                    stats.end_refresh(duration)
+                if tracer is not None:
+                    tracer.add_event(
+                        'RecycleView.refresh_views', t, duration, None)
+            return
+
         flags = self._refresh_flags
         flags.update(kwargs)
         lm = self.layout_manager
+        call = _call if stats is None else stats.time_call
 
         try:
-            append = False
+            append = ranges = False
             update = flags['all']
             if update:
                 flags['all'] = False
-                lm.recycleview_setup()
+                call('setup_time', lm.recycleview_setup)
             else:
                 update = flags['data']
 
@@ -776,20 +3898,31 @@ class RecycleView(ScrollView):
                 flags['data'] = False
                 self.layout_manager.clear_layout()
             else:
-                append = flags['data_add'] and not flags['data_size']
-                update = flags['data_size'] or flags['data_add']
+                ranges = flags['data_range'] and not flags['data_size']
+                append = flags['data_add'] and not flags['data_size'] and \
+                    not ranges
+                update = flags['data_size'] or flags['data_add'] or \
+                    flags['data_range']
 
             if update:
                 flags['data_size'] = flags['data_add'] = False
-                lm.compute_positions_and_sizes(append)
+                flags['data_range'] = False
+                changes = self._data_changes
+                self._data_changes = []
+                if ranges:
+                    call('sizes_time', lm.update_positions_and_sizes, changes)
+                else:
+                    call('sizes_time', lm.compute_positions_and_sizes, append)
 
             if update or flags['viewport']:
                 flags['viewport'] = False
-                if self.data:
-                    lm.compute_visible_views()
+                if len(self.adapter):
+                    call('visible_time', lm.compute_visible_views)
         except LayoutChangeException:
             # at a minimum we will have to recompute the size
             flags['data_size'] = True
+            if stats is not None:
+                stats.count('layout_retries')
             self.refresh_views()
 
     def ask_refresh_all(self, *largs):
@@ -800,6 +3933,14 @@ class RecycleView(ScrollView):
         '''Accepts extent as a flag kwarg.
         '''
         extent = kwargs.get('extent', 'data')
+        if extent in ('data_modified', 'data_insert', 'data_remove'):
+            if kwargs.get('start') is None or kwargs.get('stop') is None:
+                raise ValueError(
+                    'The {} extent requires a start and stop'.format(extent))
+            self.adapter.dispatch(
+                'on_data_changed', extent=extent, start=kwargs['start'],
+                stop=kwargs['stop'])
+            return
         if extent not in ('data', 'data_size', 'data_add'):
             raise ValueError('{} is not a valid extent'.format(extent))
         self.adapter.dispatch('on_data_changed', extent=extent)
@@ -808,8 +3949,29 @@ class RecycleView(ScrollView):
         self._refresh_flags['viewport'] = True
         self._refresh_trigger()
 
-    def get_views(self, i_start, i_end):
-        return self.adapter.get_views(i_start, i_end)
+    def report_view_size(self, view, size):
+        '''Gives the size, in the layout direction, that the displayed `view`
+        needs, e.g. from a label's `texture_size` once it's rendered. It's
+        used when the layout manager measures the items, see
+        :attr:`LinearRecycleLayoutManager.auto_size`.
+        '''
+        for index, item_view in self.adapter.views.items():
+            if item_view is view:
+                self.layout_manager.set_measured_size(index, size)
+                return
+
+    def get_views(self, i_start, i_end, indices=None):
+        adapter = self.adapter
+        views = adapter.get_views(i_start, i_end, indices)
+        stats = self.stats
+        if stats is not None:
+            # the layout manager lays out all the new views
+            for view, index in views[0]:
+                stats.count_class('refresh_view_layout', view.__class__)
+        if adapter.deferred_views:
+            # continue in the next frame, not in this one
+            self._deferred_trigger()
+        return views
 
     @property
     def observable_dict(self):
@@ -825,7 +3987,14 @@ class RecycleView(ScrollView):
 
 
     def _handle_ask_data_refresh(self, *largs, **kwargs):
-        self._refresh_flags[kwargs['extent']] = True
+        extent = kwargs['extent']
+        start = kwargs.get('start')
+        if extent in ('data_add', 'data_modified', 'data_insert',
+                      'data_remove') and start is not None:
+            self._data_changes.append((extent, start, kwargs['stop']))
+            if extent != 'data_add':
+                extent = 'data_range'
+        self._refresh_flags[extent] = True
         self._refresh_trigger()
 
     def _get_adapter(self):
@@ -842,7 +4011,11 @@ class RecycleView(ScrollView):
             funbind('viewclass', self._dispatch_prop_on_source, 'viewclass')
             funbind('key_viewclass', self._dispatch_prop_on_source,
                     'key_viewclass')
+            funbind('key_id', self._dispatch_prop_on_source, 'key_id')
+            funbind('prewarm', self._dispatch_prop_on_source, 'prewarm')
             funbind('data', self._dispatch_prop_on_source, 'data')
+            funbind('data_source', self._dispatch_prop_on_source,
+                    'data_source')
 
         if value is None:
             self._adapter = adapter = RecycleAdapter()
@@ -854,11 +4027,17 @@ class RecycleView(ScrollView):
             self._adapter = adapter = value
 
         adapter.attach_recycleview(self)
+        adapter._stats = self.stats
+        if self.tracer is not None:
+            self._install_tracer()
         fbind = adapter.fbind if _kivy_1_9_1 else adapter.fast_bind
         fbind('on_data_changed', self._handle_ask_data_refresh)
         fbind('viewclass', self._dispatch_prop_on_source, 'viewclass')
         fbind('key_viewclass', self._dispatch_prop_on_source, 'key_viewclass')
+        fbind('key_id', self._dispatch_prop_on_source, 'key_id')
+        fbind('prewarm', self._dispatch_prop_on_source, 'prewarm')
         fbind('data', self._dispatch_prop_on_source, 'data')
+        fbind('data_source', self._dispatch_prop_on_source, 'data_source')
         self.ask_refresh_from_data()
         return True
 
@@ -890,6 +4069,8 @@ class RecycleView(ScrollView):
             self._layout_manager = lm = value
 
         lm.attach_recycleview(self)
+        if self.tracer is not None:
+            self._install_tracer()
         fbind = lm.fbind if _kivy_1_9_1 else lm.fast_bind
         fbind('default_size', self._dispatch_prop_on_source, 'default_size')
         fbind('key_size', self._dispatch_prop_on_source, 'key_size')
@@ -917,6 +4098,8 @@ class RecycleView(ScrollView):
         else:
             c = self._container = value
         self.add_widget(c)
+        if self.tracer is not None:
+            self._install_tracer()
         self.ask_refresh_from_data(extent='data_size')
         return True
 
@@ -933,6 +4116,16 @@ class RecycleView(ScrollView):
     """Set the data on the current adapter
     """
 
+    def _get_data_source(self):
+        return self.adapter.data_source
+    def _set_data_source(self, value):
+        self.adapter.data_source = value
+    data_source = AliasProperty(_get_data_source, _set_data_source,
+                                bind=["adapter"])
+    """Set the data source, used instead of the data, on the current adapter.
+    See :class:`RecycleDataSource`.
+    """
+
     def _get_viewclass(self):
         return self.adapter.viewclass
     def _set_viewclass(self, value):
@@ -951,6 +4144,26 @@ class RecycleView(ScrollView):
     """Set the key viewclass on the current adapter
     """
 
+    def _get_key_id(self):
+        return self.adapter.key_id
+    def _set_key_id(self, value):
+        self.adapter.key_id = value
+    key_id = AliasProperty(_get_key_id, _set_key_id, bind=["adapter"])
+    """Set the key to look for the stable id of the data items on the current
+    adapter. When the data list is replaced or re-ordered, e.g. sorted, the
+    views of the items whose id is found in the new data, with the same
+    values, are kept and only repositioned instead of being synced again.
+    """
+
+    def _get_prewarm(self):
+        return self.adapter.prewarm
+    def _set_prewarm(self, value):
+        self.adapter.prewarm = value
+    prewarm = AliasProperty(_get_prewarm, _set_prewarm, bind=["adapter"])
+    """Set the number of views of each viewclass to create ahead of time on
+    the current adapter, see :attr:`RecycleAdapter.prewarm`.
+    """
+
     def _get_default_size(self):
         return self.layout_manager.default_size
     def _set_default_size(self, value):
@@ -968,3 +4181,47 @@ class RecycleView(ScrollView):
                              bind=["layout_manager"])
     """Set the key to look for the size on the current `layout_manager`
     """
+
+    stats = ObjectProperty(None, allownone=True)
+    """A :class:`RecycleViewStats` counting the work done in each refresh, or
+    None, the default, to not count anything. E.g.::
+
+        rv.stats = RecycleViewStats()
+        rv.stats.bind(on_refresh=lambda stats, counters: send(counters))
+    """
+
+    def on_stats(self, instance, value):
+        self.adapter._stats = value
+
+    tracer = ObjectProperty(None, allownone=True)
+    """A :class:`RecycleViewTracer`, e.g. a :class:`RecycleViewTraceBuffer`,
+    receiving the timings of the hot paths in the refreshes, or None, the
+    default. The methods are only wrapped while tracing, so there's no cost
+    otherwise. E.g.::
+
+        rv.tracer = RecycleViewTraceBuffer()
+        ...
+        rv.tracer.save('scroll.json')
+    """
+
+    def on_tracer(self, instance, value):
+        self._install_tracer()
+
+    def _install_tracer(self):
+        '''Wraps the traced methods of the current adapter, layout manager
+        and container, after removing the wrappers of the previous ones.
+        '''
+        for obj, name in self._traced:
+            obj.__dict__.pop(name, None)
+        self._traced = []
+        tracer = self.tracer
+        if tracer is None:
+            return
+        for prop, name, describe in _trace_hooks:
+            obj = getattr(self, prop)
+            if obj is None:
+                continue
+            setattr(obj, name, tracer.wrap(
+                '{}.{}'.format(obj.__class__.__name__, name),
+                getattr(obj, name), describe))
+            self._traced.append((obj, name))
@@ -0,0 +1,25 @@
+'''
+The tests run headless, with the GL calls mocked as in the benchmarks, and
+import this directory as the `kivy.garden.recycleview` package, as when it's
+installed with garden. Run them with::
+
+    python -m pytest tests
+'''
+import os
+import sys
+import importlib.util
+os.environ.setdefault('KIVY_GL_BACKEND', 'mock')
+os.environ['KIVY_NO_ARGS'] = '1'
+os.environ.setdefault('KIVY_NO_CONSOLELOG', '1')
+
+from kivy.config import Config
+Config.set('graphics', 'maxfps', '0')
+import kivy.garden
+
+_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_spec = importlib.util.spec_from_file_location(
+    'kivy.garden.recycleview', os.path.join(_root, '__init__.py'),
+    submodule_search_locations=[_root])
+_module = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = _module
+_spec.loader.exec_module(_module)
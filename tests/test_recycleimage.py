@@ -0,0 +1,44 @@
+import time
+
+import pytest
+from kivy.clock import Clock
+# the textures are made in the gl context of the window
+from kivy.core.window import Window
+from kivy.core.image import Image as CoreImage
+from kivy.garden.recycleview import RecycleImageLoader
+
+PILImage = pytest.importorskip('PIL.Image')
+
+
+def wait_texture(loader, source, size):
+    textures = []
+    loader.request(
+        source, size, lambda key, texture: textures.append(texture))
+    deadline = time.time() + 10
+    while not textures and time.time() < deadline:
+        Clock.tick()
+        time.sleep(.01)
+    return textures[0]
+
+
+def test_decoded_orientation(tmp_path):
+    # red on top, blue at the bottom
+    image = PILImage.new('RGB', (8, 8), (0, 0, 255))
+    image.paste((255, 0, 0), (0, 0, 8, 4))
+    source = str(tmp_path / 'image.png')
+    image.save(source)
+
+    loader = RecycleImageLoader()
+    try:
+        data = loader.decode(source, (8, 8))
+        assert data.flip_vertical
+        assert data.data[:3] == b'\xff\x00\x00'
+
+        texture = wait_texture(loader, source, (8, 8))
+        # like the textures of the kivy image loaders, the first row is
+        # shown at the top
+        expected = CoreImage(source, nocache=True).texture
+        assert texture.tex_coords == expected.tex_coords
+        assert texture.uvsize[1] < 0
+    finally:
+        loader.close()
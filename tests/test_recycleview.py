@@ -0,0 +1,70 @@
+import pytest
+from kivy.clock import Clock
+from kivy.lang import Builder
+from kivy.uix.label import Label
+from kivy.garden.recycleview import RecycleView, RecycleAdapter, \
+    RecycleViewPool
+
+
+class PrewarmItem(Label):
+    pass
+
+
+class PrewarmView(RecycleView):
+    pass
+
+
+def test_prewarm_in_kv():
+    rv = Builder.load_string('''
+PrewarmView:
+    viewclass: 'PrewarmItem'
+    prewarm: {'PrewarmItem': 5}
+''')
+    assert rv.prewarm == {'PrewarmItem': 5}
+    assert rv.adapter.prewarm == {'PrewarmItem': 5}
+    done = []
+    rv.adapter.bind(on_prewarm_done=lambda *largs: done.append(True))
+    for _ in range(100):
+        if done:
+            break
+        Clock.tick()
+    assert rv.adapter.view_pool.get_stats()['size'] == 5
+
+
+def test_shared_empty_pool():
+    pool = RecycleViewPool()
+    first = RecycleAdapter(view_pool=pool)
+    second = RecycleAdapter(view_pool=pool)
+    assert first.view_pool is pool and second.view_pool is pool
+
+    rv = RecycleView(size=(100, 100), size_hint=(None, None))
+    rv.adapter = first
+    rv.viewclass = Label
+    rv.data = [{'text': str(i)} for i in range(10)]
+    rv.refresh_views()
+    rv.data = []
+    rv.refresh_views()
+    assert len(pool)
+    assert second.view_pool.get(Label) is not None
+
+
+@pytest.mark.parametrize('detach_views', [True, False])
+def test_sticky_header_drawn_last(detach_views):
+    rv = RecycleView(size=(100, 500), size_hint=(None, None))
+    rv.adapter.detach_views = detach_views
+    rv.viewclass = Label
+    rv.key_size = 'height'
+    rv.layout_manager.key_header = 'header'
+    rv.data = [{'text': str(i), 'height': 50, 'header': i % 20 == 0}
+               for i in range(400)]
+    canvas = rv.container.canvas
+    for i in range(60):
+        rv.scroll_y = 1 - i / 59.
+        rv.refresh_views()
+        Clock.tick()
+        header = rv.layout_manager._header_view
+        assert header is not None and header.parent is rv.container
+        drawn = canvas.indexof(header.canvas)
+        assert drawn != -1
+        for view in rv.adapter.views.values():
+            assert canvas.indexof(view.canvas) < drawn, i